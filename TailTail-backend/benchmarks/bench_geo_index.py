@@ -0,0 +1,97 @@
+"""Nearby-query latency of ``GeoGridIndex`` as the post count grows.
+
+Run from TailTail-backend/:
+
+    python -m benchmarks.bench_geo_index [--sizes 10000,100000,1000000]
+
+Points are scattered around a handful of Kazakh cities (where the app's
+users are), and queries are drawn from the same distribution. A linear scan
+is timed alongside for the smaller sizes to show what the index replaces.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from src.services.post.geo_index import GeoGridIndex, haversine_km
+
+CITIES = [
+    (43.238, 76.889),  # Almaty
+    (51.169, 71.449),  # Astana
+    (42.341, 69.590),  # Shymkent
+    (49.806, 73.085),  # Karaganda
+    (50.283, 57.167),  # Aktobe
+]
+SPREAD_DEG = 0.08
+
+
+def random_point(rng: random.Random) -> tuple[float, float]:
+    lat, lng = rng.choice(CITIES)
+    return rng.gauss(lat, SPREAD_DEG), rng.gauss(lng, SPREAD_DEG * 1.4)
+
+
+def linear_nearest(points, lat, lng, radius_km, limit):
+    hits = []
+    for point_id, (plat, plng) in points:
+        distance = haversine_km(lat, lng, plat, plng)
+        if distance <= radius_km:
+            hits.append((distance, point_id))
+    hits.sort()
+    return hits[:limit]
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def time_queries(fn, queries) -> list[float]:
+    samples = []
+    for lat, lng in queries:
+        start = time.perf_counter()
+        fn(lat, lng)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--radius-km", type=float, default=5.0)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--linear-max", type=int, default=100000, help="skip the linear scan above this size")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    queries = [random_point(rng) for _ in range(args.queries)]
+
+    print(f"{'posts':>9} {'build s':>8} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8} {'linear p50 ms':>14}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        points = [(str(i), random_point(rng)) for i in range(size)]
+        index = GeoGridIndex()
+        start = time.perf_counter()
+        for point_id, (lat, lng) in points:
+            index.insert(point_id, lat, lng)
+        build = time.perf_counter() - start
+
+        samples = time_queries(lambda lat, lng: index.nearest(lat, lng, args.radius_km, args.limit), queries)
+
+        linear = "-"
+        if size <= args.linear_max:
+            linear_samples = time_queries(
+                lambda lat, lng: linear_nearest(points, lat, lng, args.radius_km, args.limit), queries[:50]
+            )
+            linear = f"{statistics.median(linear_samples):.2f}"
+
+        print(
+            f"{size:>9} {build:>8.2f} {statistics.median(samples):>8.3f} "
+            f"{percentile(samples, 0.99):>8.3f} {statistics.fmean(samples):>8.3f} {linear:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from src.api.common import json_response, read_json, required, services
+
+routes = web.RouteTableDef()
+
+
+@routes.post("/api/v1/auth/signup")
+async def signup(request: web.Request) -> web.Response:
+    body = await read_json(request)
+    user = services(request).auth.signup(str(required(body, "email")), str(required(body, "password")))
+    return json_response({"message": "User created successfully", "id": user.id}, status=201)
+
+
+@routes.post("/api/v1/auth/login")
+async def login(request: web.Request) -> web.Response:
+    body = await read_json(request)
+    token = services(request).auth.login(str(required(body, "email")), str(required(body, "password")))
+    return json_response({"token": token, "token_type": "bearer"})
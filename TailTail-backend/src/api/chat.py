@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from src.api.common import json_response, read_json, require_user, services
+
+routes = web.RouteTableDef()
+
+# The production API takes {"participant_ids": [...]}; the single-id field
+# names earlier scripts probed with are accepted as well.
+PARTICIPANT_FIELDS = ("user_id", "recipient_id", "other_user_id", "participant_id")
+
+
+def _other_participant(body: dict, user_id: str) -> str:
+    participants = body.get("participant_ids") or body.get("participants") or body.get("users")
+    if isinstance(participants, list):
+        others = [str(participant) for participant in participants if str(participant) != user_id]
+        if len(others) == 1:
+            return others[0]
+        if others:
+            raise ValueError("group chats are not supported")
+    for name in PARTICIPANT_FIELDS:
+        if body.get(name):
+            return str(body[name])
+    raise ValueError("participant_ids is required")
+
+
+@routes.get("/api/v1/chat/chats")
+async def list_chats(request: web.Request) -> web.Response:
+    user = require_user(request)
+    svc = services(request)
+    chats = svc.chats.list_chats(user.id)
+    return json_response([svc.chats.chat_to_dict(chat, user.id, svc.connections.is_online) for chat in chats])
+
+
+@routes.post("/api/v1/chat/chats")
+async def create_chat(request: web.Request) -> web.Response:
+    user = require_user(request)
+    svc = services(request)
+    chat = svc.chats.create_chat(user.id, _other_participant(await read_json(request), user.id))
+    return json_response(svc.chats.chat_to_dict(chat, user.id, svc.connections.is_online), status=201)
+
+
+@routes.delete("/api/v1/chat/chats/{chat_id}")
+async def delete_chat(request: web.Request) -> web.Response:
+    user = require_user(request)
+    services(request).chats.delete_chat(request.match_info["chat_id"], user.id)
+    return json_response({"message": "Chat deleted"})
+
+
+@routes.get("/api/v1/messages/chats/{chat_id}/messages")
+async def list_messages(request: web.Request) -> web.Response:
+    user = require_user(request)
+    chats = services(request).chats
+    messages = chats.get_messages(request.match_info["chat_id"], user.id)
+    return json_response([chats.message_to_dict(message) for message in messages])
@@ -0,0 +1,96 @@
+"""Helpers shared by the HTTP route modules.
+
+Error bodies follow the ``{"detail": ...}`` shape of the production API;
+the iOS client looks for "Token expired!" in 401 bodies to log out.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+
+from aiohttp import web
+
+from src.services.auth.auth_service import AuthenticationError
+from src.services.container import Services
+from src.services.user.user_service import EmailTakenError, User
+
+SERVICES = web.AppKey("services", Services)
+
+dumps = functools.partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_response(data, status: int = 200) -> web.Response:
+    return web.json_response(data, status=status, dumps=dumps)
+
+
+def error_response(status: int, detail: str) -> web.Response:
+    return json_response({"detail": detail}, status=status)
+
+
+def services(request: web.Request) -> Services:
+    return request.app[SERVICES]
+
+
+def bearer(request: web.Request) -> str | None:
+    """The Authorization header, falling back to a ``token`` query parameter
+    (some WebSocket clients cannot set headers)."""
+    header = request.headers.get("Authorization")
+    if header:
+        return header
+    token = request.query.get("token")
+    return f"Bearer {token}" if token else None
+
+
+def require_user(request: web.Request) -> User:
+    return services(request).auth.authenticate(bearer(request))
+
+
+def optional_user(request: web.Request) -> User | None:
+    if bearer(request) is None:
+        return None
+    return require_user(request)
+
+
+async def read_json(request: web.Request) -> dict:
+    try:
+        body = await request.json(loads=json.loads)
+    except json.JSONDecodeError:
+        raise ValueError("request body is not valid JSON") from None
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    return body
+
+
+def required(body: dict, name: str):
+    value = body.get(name)
+    if value in (None, ""):
+        raise ValueError(f"{name} is required")
+    return value
+
+
+def query_int(request: web.Request, name: str, default: int, minimum: int = 1, maximum: int = 100) -> int:
+    raw = request.query.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer") from None
+    return max(minimum, min(maximum, value))
+
+
+@web.middleware
+async def error_middleware(request: web.Request, handler):
+    try:
+        return await handler(request)
+    except AuthenticationError as exc:
+        return error_response(401, str(exc))
+    except PermissionError as exc:
+        return error_response(403, str(exc) or "Forbidden")
+    except EmailTakenError:
+        return error_response(400, "Email already registered")
+    except LookupError:
+        return error_response(404, "Not found")
+    except ValueError as exc:
+        return error_response(400, str(exc))
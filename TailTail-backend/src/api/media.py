@@ -0,0 +1,30 @@
+"""Uploaded files: storing them and serving them back under /media/."""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+from aiohttp import BodyPartReader, web
+
+from src.api.common import services
+
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+ALLOWED_SUFFIXES = {".jpg", ".jpeg", ".png", ".heic", ".gif", ".webp"}
+
+
+def media_url(request: web.Request, name: str) -> str:
+    return f"{request.url.origin()}/media/{name}"
+
+
+async def save_upload(request: web.Request, part: BodyPartReader) -> str:
+    """Write one multipart file to the media directory and return its URL."""
+    suffix = Path(part.filename or "").suffix.lower()
+    if suffix not in ALLOWED_SUFFIXES:
+        suffix = ".jpg"
+    data = await part.read()
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise ValueError("file is too large")
+    name = f"{uuid.uuid4().hex}{suffix}"
+    (services(request).media_dir / name).write_bytes(data)
+    return media_url(request, name)
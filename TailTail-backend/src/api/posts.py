@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from src.api.common import (
+    json_response,
+    optional_user,
+    query_int,
+    read_json,
+    require_user,
+    required,
+    services,
+)
+from src.api.media import save_upload
+from src.services.post.post_service import Post, format_timestamp, parse_timestamp
+
+routes = web.RouteTableDef()
+
+# Form field names sent by NetworkManager.uploadPost, mapped to post fields.
+FORM_FIELDS = {
+    "petName": "pet_name",
+    "petSpecies": "pet_species",
+    "petBreed": "pet_breed",
+    "age": "age",
+    "gender": "gender",
+    "weight": "weight",
+    "color": "color",
+    "description": "description",
+    "locationName": "location_name",
+    "contactPhone": "contact_phone",
+    "status": "status",
+}
+NUMERIC_FIELDS = ("age", "weight")
+
+
+def _coerce(fields: dict) -> dict:
+    """Turn form/JSON input into ``PostService`` keyword arguments."""
+    result = {}
+    for key, value in fields.items():
+        name = FORM_FIELDS.get(key, key)
+        if name in NUMERIC_FIELDS and value not in (None, ""):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{name} must be a number") from None
+        result[name] = value
+    lat, lng = result.pop("lat", None), result.pop("lng", None)
+    if lat not in (None, "") and lng not in (None, ""):
+        result["last_seen_location"] = (lat, lng)
+    return result
+
+
+def _post_dicts(request: web.Request, posts: list[Post], viewer_id: str | None) -> list[dict]:
+    post_service = services(request).posts
+    return [post.to_dict(is_liked=post_service.is_liked(post.id, viewer_id)) for post in posts]
+
+
+@routes.get("/api/v1/posts/")
+@routes.get("/api/v1/posts")
+async def list_posts(request: web.Request) -> web.Response:
+    """Three modes: ``page``/``size`` offset pages (the original contract),
+    ``cursor`` keyset pages, and ``since`` deltas."""
+    viewer = optional_user(request)
+    viewer_id = viewer.id if viewer else None
+    post_service = services(request).posts
+    size = query_int(request, "size", 10)
+
+    if "since" in request.query:
+        since = parse_timestamp(request.query["since"]) if request.query["since"] else None
+        delta = post_service.changed_since(since, limit=query_int(request, "limit", 100, maximum=500))
+        watermark = delta["watermark"]
+        return json_response(
+            {
+                **delta,
+                "posts": _post_dicts(request, delta["posts"], viewer_id),
+                "watermark": format_timestamp(watermark) if watermark else None,
+            }
+        )
+
+    if "cursor" in request.query:
+        page = post_service.list_posts_after(request.query["cursor"] or None, size)
+        return json_response({**page, "posts": _post_dicts(request, page["posts"], viewer_id)})
+
+    page = post_service.list_posts(query_int(request, "page", 1, maximum=1_000_000), size)
+    return json_response({**page, "posts": _post_dicts(request, page["posts"], viewer_id)})
+
+
+@routes.get("/api/v1/posts/nearby")
+async def nearby_posts(request: web.Request) -> web.Response:
+    viewer = optional_user(request)
+    try:
+        lat = float(request.query["lat"])
+        lng = float(request.query["lng"])
+        radius_km = float(request.query.get("radius", 50.0))
+    except KeyError as exc:
+        raise ValueError(f"{exc.args[0]} is required") from None
+    limit = query_int(request, "limit", 20)
+    post_service = services(request).posts
+    viewer_id = viewer.id if viewer else None
+    posts = []
+    for post, distance in post_service.nearby(lat, lng, radius_km, limit):
+        posts.append({**post.to_dict(is_liked=post_service.is_liked(post.id, viewer_id)), "distance_km": round(distance, 3)})
+    return json_response({"posts": posts})
+
+
+@routes.post("/api/v1/posts/")
+@routes.post("/api/v1/posts")
+async def create_post(request: web.Request) -> web.Response:
+    user = require_user(request)
+    fields: dict = {}
+    images: list[str] = []
+    if request.content_type.startswith("multipart/"):
+        reader = await request.multipart()
+        async for part in reader:
+            if part.filename:
+                images.append(await save_upload(request, part))
+            elif part.name:
+                fields[part.name] = await part.text()
+    else:
+        fields = await read_json(request)
+        images = list(fields.pop("images", None) or [])
+    post = services(request).posts.create_post(user.id, images=images, **_coerce(fields))
+    return json_response({"post": post.to_dict()}, status=201)
+
+
+@routes.get("/api/v1/posts/{post_id}")
+async def get_post(request: web.Request) -> web.Response:
+    viewer = optional_user(request)
+    post_service = services(request).posts
+    post = post_service.get_post(request.match_info["post_id"])
+    return json_response(post.to_dict(is_liked=post_service.is_liked(post.id, viewer.id if viewer else None)))
+
+
+@routes.patch("/api/v1/posts/{post_id}")
+async def update_post(request: web.Request) -> web.Response:
+    user = require_user(request)
+    post_service = services(request).posts
+    post = post_service.get_post(request.match_info["post_id"])
+    if post.user_id != user.id:
+        raise PermissionError("You can only edit your own posts")
+    post = post_service.update_post(post.id, **_coerce(await read_json(request)))
+    return json_response({"post": post.to_dict(is_liked=post_service.is_liked(post.id, user.id))})
+
+
+@routes.delete("/api/v1/posts/{post_id}")
+async def delete_post(request: web.Request) -> web.Response:
+    user = require_user(request)
+    post_service = services(request).posts
+    post = post_service.get_post(request.match_info["post_id"])
+    if post.user_id != user.id:
+        raise PermissionError("You can only delete your own posts")
+    post_service.delete_post(post.id)
+    return web.Response(status=204)
+
+
+@routes.post("/api/v1/posts/{post_id}/like")
+async def toggle_like(request: web.Request) -> web.Response:
+    user = require_user(request)
+    post_service = services(request).posts
+    post_id = request.match_info["post_id"]
+    liked = post_service.toggle_like(post_id, user.id)
+    return json_response({"liked": liked, "likes_count": post_service.get_post(post_id).likes_count})
+
+
+@routes.post("/api/v1/posts/{post_id}/complaint")
+async def report_post(request: web.Request) -> web.Response:
+    user = require_user(request)
+    body = await read_json(request)
+    services(request).posts.report_post(request.match_info["post_id"], user.id, str(required(body, "complaint")))
+    return json_response({"message": "Complaint submitted"}, status=201)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from src.api.common import json_response, read_json, require_user, required, services
+from src.api.media import save_upload
+
+routes = web.RouteTableDef()
+
+
+@routes.get("/api/v1/users/profile")
+@routes.get("/api/v1/users/me")
+async def get_profile(request: web.Request) -> web.Response:
+    return json_response(require_user(request).to_dict())
+
+
+@routes.patch("/api/v1/users/profile")
+async def update_profile(request: web.Request) -> web.Response:
+    user = require_user(request)
+    changes: dict = {}
+    if request.content_type.startswith("multipart/"):
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "profile_image" and part.filename:
+                changes["image_url"] = await save_upload(request, part)
+            elif part.name in ("name", "phone", "current_password", "new_password"):
+                changes[part.name] = await part.text()
+    else:
+        body = await read_json(request)
+        changes = {key: body[key] for key in ("name", "phone", "current_password", "new_password") if key in body}
+    updated = services(request).users.update_profile(user.id, **changes)
+    return json_response(updated.to_dict())
+
+
+@routes.delete("/api/v1/users/profile")
+async def delete_account(request: web.Request) -> web.Response:
+    user = require_user(request)
+    services(request).users.delete_user(user.id)
+    return web.Response(status=204)
+
+
+@routes.post("/api/v1/users/block/")
+@routes.post("/api/v1/users/block")
+async def block_user(request: web.Request) -> web.Response:
+    user = require_user(request)
+    body = await read_json(request)
+    services(request).users.block(user.id, str(required(body, "blocked_id")))
+    return json_response({"message": "User blocked"}, status=201)
+
+
+@routes.get("/api/v1/users/block/")
+@routes.get("/api/v1/users/block")
+async def list_blocked(request: web.Request) -> web.Response:
+    user = require_user(request)
+    return json_response([blocked.to_dict() for blocked in services(request).users.blocked_users(user.id)])
+
+
+@routes.delete("/api/v1/users/block/{user_id}")
+async def unblock_user(request: web.Request) -> web.Response:
+    user = require_user(request)
+    if not services(request).users.unblock(user.id, request.match_info["user_id"]):
+        raise LookupError(request.match_info["user_id"])
+    return web.Response(status=204)
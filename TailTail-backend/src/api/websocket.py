@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from aiohttp import WSMsgType, web
+
+from src.api.common import dumps, error_response, require_user, services
+from src.services.websocket.websocket_service import WebSocketSession, error_frame
+
+logger = logging.getLogger(__name__)
+
+routes = web.RouteTableDef()
+
+HEARTBEAT_SECONDS = 60.0
+
+
+@routes.get("/api/v1/websocket/ws/{user_id}")
+async def websocket(request: web.Request) -> web.StreamResponse:
+    user = require_user(request)
+    if user.id != request.match_info["user_id"]:
+        return error_response(403, "Token does not match user_id")
+
+    ws = web.WebSocketResponse(heartbeat=HEARTBEAT_SECONDS)
+    await ws.prepare(request)
+    svc = services(request)
+
+    async def send(frame: dict) -> None:
+        if ws.closed:
+            raise ConnectionError("WebSocket is closed")
+        await ws.send_str(dumps(frame))
+
+    session = WebSocketSession(user.id, send, svc.post_events, chats=svc.chats, connections=svc.connections)
+    svc.connections.add(session)
+    try:
+        async for message in ws:
+            if message.type != WSMsgType.TEXT:
+                continue
+            try:
+                frame = json.loads(message.data)
+            except json.JSONDecodeError:
+                await send(error_frame("Invalid JSON"))
+                continue
+            await session.handle(frame)
+    finally:
+        svc.connections.remove(session)
+        await session.close()
+    return ws
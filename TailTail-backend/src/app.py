@@ -0,0 +1,26 @@
+"""aiohttp application serving the TailTrail API.
+
+Implements the surface the iOS client and the scripts in the repository
+root use: auth, profile and block list, posts (feed, nearby, likes,
+complaints), chats and messages, and the chat/post WebSocket. State is held
+in memory, which makes it a fast local stand-in for benchmarking.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from aiohttp import web
+
+from src.api import auth, chat, posts, users, websocket
+from src.api.common import SERVICES, error_middleware
+from src.services.container import Services
+
+
+def create_app(secret: bytes, media_dir: Path, services: Services | None = None) -> web.Application:
+    app = web.Application(middlewares=[error_middleware], client_max_size=100 * 1024 * 1024)
+    app[SERVICES] = services or Services.create(secret, media_dir)
+    for module in (auth, users, posts, chat, websocket):
+        app.add_routes(module.routes)
+    app.router.add_static("/media", app[SERVICES].media_dir)
+    return app
@@ -0,0 +1,77 @@
+"""Run the local TailTrail API server.
+
+    cd TailTail-backend
+    python -m src.main --port 8080
+
+Then point scripts at it with TAILTRAIL_BASE_URL=http://127.0.0.1:8080
+(the default). Requires aiohttp; uses uvloop when it is installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import tempfile
+from pathlib import Path
+
+from aiohttp import web
+
+from src.app import create_app
+from src.services.container import Services
+
+DEV_SECRET = "tailtrail-dev-secret"
+SPECIES = ("dog", "cat", "bird", "other")
+STATUSES = ("lost", "found")
+CITIES = ((43.238, 76.889, "Almaty"), (51.169, 71.449, "Astana"), (42.341, 69.590, "Shymkent"))
+
+
+def seed_posts(services: Services, count: int, seed: int = 7) -> None:
+    """Fill the store with plausible posts so feeds and maps have content."""
+    rng = random.Random(seed)
+    owner = services.users.create_user("seed@tailtrail.local", "password123")
+    for i in range(count):
+        lat, lng, city = rng.choice(CITIES)
+        services.posts.create_post(
+            owner.id,
+            pet_name=f"Pet {i}",
+            pet_species=rng.choice(SPECIES),
+            status=rng.choice(STATUSES),
+            color=rng.choice(("black", "white", "brown", "ginger", "grey")),
+            location_name=city,
+            last_seen_location=(rng.gauss(lat, 0.05), rng.gauss(lng, 0.07)),
+            description="Seeded post",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local TailTrail API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--secret", default=os.environ.get("TAILTRAIL_JWT_SECRET", DEV_SECRET))
+    parser.add_argument("--media-dir", type=Path, default=Path(tempfile.gettempdir()) / "tailtrail-media")
+    parser.add_argument("--seed-posts", type=int, default=0, help="number of fake posts to start with")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    app = create_app(args.secret.encode(), args.media_dir)
+    if args.seed_posts:
+        from src.api.common import SERVICES
+
+        seed_posts(app[SERVICES], args.seed_posts)
+    print(f"TailTrail API listening on http://{args.host}:{args.port}")
+    web.run_app(app, host=args.host, port=args.port, access_log=None, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Signup, login and bearer-token authentication."""
+
+from __future__ import annotations
+
+import time
+
+from src.services.auth.jwt_tokens import TokenError, decode_token, encode_token
+from src.services.user.user_service import User, UserNotFoundError, UserService, check_password
+
+DEFAULT_TOKEN_TTL = 7 * 24 * 3600
+
+
+class AuthenticationError(Exception):
+    """Raised for bad credentials or tokens; the message is safe to return."""
+
+
+class AuthService:
+    def __init__(self, users: UserService, secret: bytes, token_ttl: int = DEFAULT_TOKEN_TTL):
+        self._users = users
+        self._secret = secret
+        self._token_ttl = token_ttl
+
+    def signup(self, email: str, password: str) -> User:
+        return self._users.create_user(email, password)
+
+    def login(self, email: str, password: str) -> str:
+        user = self._users.find_by_email(email)
+        if user is None or not check_password(password, user.password_hash):
+            raise AuthenticationError("Invalid email or password")
+        return self.issue_token(user.id)
+
+    def issue_token(self, user_id: str) -> str:
+        return encode_token({"user_id": user_id, "exp": int(time.time()) + self._token_ttl}, self._secret)
+
+    def authenticate(self, authorization: str | None) -> User:
+        """Resolve an ``Authorization: Bearer <token>`` header (or a bare
+        token) to the user it was issued to."""
+        if not authorization:
+            raise AuthenticationError("Not authenticated")
+        scheme, _, token = authorization.partition(" ")
+        if not token:
+            token = scheme
+        elif scheme.lower() != "bearer":
+            raise AuthenticationError("Not authenticated")
+        try:
+            claims = decode_token(token.strip(), self._secret)
+        except TokenError as exc:
+            raise AuthenticationError(str(exc)) from None
+        try:
+            return self._users.get_user(str(claims.get("user_id")))
+        except UserNotFoundError:
+            raise AuthenticationError("User not found") from None
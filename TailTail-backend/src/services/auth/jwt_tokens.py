@@ -0,0 +1,66 @@
+"""HS256 JSON Web Tokens, as issued by /api/v1/auth/login.
+
+Tokens carry ``user_id`` and ``exp`` (Unix seconds), the same claims the
+production backend issues and the iOS client and test scripts read.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+
+_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+class TokenError(ValueError):
+    pass
+
+
+class TokenExpiredError(TokenError):
+    pass
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _sign(signing_input: bytes, secret: bytes) -> str:
+    return _b64encode(hmac.new(secret, signing_input, hashlib.sha256).digest())
+
+
+_ENCODED_HEADER = _b64encode(json.dumps(_HEADER, separators=(",", ":")).encode())
+
+
+def encode_token(claims: dict, secret: bytes) -> str:
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{_ENCODED_HEADER}.{payload}"
+    return f"{signing_input}.{_sign(signing_input.encode('ascii'), secret)}"
+
+
+def decode_token(token: str, secret: bytes, now: float | None = None) -> dict:
+    """Verify the signature and expiry and return the claims."""
+    try:
+        header_segment, payload_segment, signature = token.split(".")
+        header = json.loads(_b64decode(header_segment))
+        claims = json.loads(_b64decode(payload_segment))
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise TokenError("Malformed token") from None
+    if not isinstance(header, dict) or header.get("alg") != "HS256" or not isinstance(claims, dict):
+        raise TokenError("Unsupported token")
+    expected = _sign(f"{header_segment}.{payload_segment}".encode("ascii"), secret)
+    if not hmac.compare_digest(expected, signature):
+        raise TokenError("Invalid token signature")
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        raise TokenError("Token has no expiry")
+    if exp <= (time.time() if now is None else now):
+        raise TokenExpiredError("Token expired!")
+    return claims
@@ -0,0 +1,139 @@
+"""Chats between users and the messages in them."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.services.post.post_service import format_timestamp, utcnow
+from src.services.user.user_service import UserService
+
+MAX_MESSAGE_LENGTH = 4000
+
+
+class ChatNotFoundError(LookupError):
+    pass
+
+
+@dataclass(slots=True)
+class Message:
+    id: str
+    chat_id: str
+    sender_id: str
+    content: str
+    created_at: datetime
+    updated_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class Chat:
+    id: str
+    participant_ids: tuple[str, ...]
+    created_at: datetime
+    updated_at: datetime
+    name: str | None = None
+    is_group: bool = False
+    messages: list[Message] = field(default_factory=list)
+    # user_id -> number of messages that user has seen
+    read_counts: dict[str, int] = field(default_factory=dict)
+
+
+class ChatService:
+    def __init__(self, users: UserService):
+        self._users = users
+        self._chats: dict[str, Chat] = {}
+        self._chats_by_user: dict[str, set[str]] = {}
+        self._direct: dict[frozenset[str], str] = {}
+
+    def create_chat(self, user_id: str, other_user_id: str) -> Chat:
+        """Open a one-to-one chat, or return the one the pair already has."""
+        if user_id == other_user_id:
+            raise ValueError("cannot start a chat with yourself")
+        self._users.get_user(other_user_id)
+        pair = frozenset((user_id, other_user_id))
+        existing = self._direct.get(pair)
+        if existing is not None:
+            return self._chats[existing]
+        now = utcnow()
+        chat = Chat(id=str(uuid.uuid4()), participant_ids=(user_id, other_user_id), created_at=now, updated_at=now)
+        self._chats[chat.id] = chat
+        self._direct[pair] = chat.id
+        for participant in chat.participant_ids:
+            self._chats_by_user.setdefault(participant, set()).add(chat.id)
+        return chat
+
+    def get_chat(self, chat_id: str, user_id: str | None = None) -> Chat:
+        """Look a chat up, optionally requiring ``user_id`` to be in it."""
+        chat = self._chats.get(chat_id)
+        if chat is None or (user_id is not None and user_id not in chat.participant_ids):
+            raise ChatNotFoundError(chat_id)
+        return chat
+
+    def list_chats(self, user_id: str) -> list[Chat]:
+        chats = [self._chats[chat_id] for chat_id in self._chats_by_user.get(user_id, ())]
+        chats.sort(key=lambda chat: chat.updated_at, reverse=True)
+        return chats
+
+    def delete_chat(self, chat_id: str, user_id: str) -> None:
+        chat = self.get_chat(chat_id, user_id)
+        del self._chats[chat.id]
+        self._direct.pop(frozenset(chat.participant_ids), None)
+        for participant in chat.participant_ids:
+            self._chats_by_user.get(participant, set()).discard(chat.id)
+
+    def send_message(self, chat_id: str, sender_id: str, content: str) -> Message:
+        content = (content or "").strip()
+        if not content:
+            raise ValueError("content must not be empty")
+        if len(content) > MAX_MESSAGE_LENGTH:
+            raise ValueError(f"content is longer than {MAX_MESSAGE_LENGTH} characters")
+        chat = self.get_chat(chat_id, sender_id)
+        message = Message(id=str(uuid.uuid4()), chat_id=chat.id, sender_id=sender_id, content=content, created_at=utcnow())
+        chat.messages.append(message)
+        chat.updated_at = message.created_at
+        chat.read_counts[sender_id] = len(chat.messages)
+        return message
+
+    def get_messages(self, chat_id: str, user_id: str) -> list[Message]:
+        chat = self.get_chat(chat_id, user_id)
+        chat.read_counts[user_id] = len(chat.messages)
+        return list(chat.messages)
+
+    def _sender(self, user_id: str) -> dict:
+        try:
+            return self._users.get_user(user_id).sender_dict()
+        except LookupError:
+            return {"id": user_id, "email": "", "image_url": None}
+
+    def message_to_dict(self, message: Message) -> dict:
+        return {
+            "id": message.id,
+            "chat_id": message.chat_id,
+            "sender": self._sender(message.sender_id),
+            "content": message.content,
+            "created_at": format_timestamp(message.created_at),
+            "updated_at": format_timestamp(message.updated_at) if message.updated_at else None,
+        }
+
+    def chat_to_dict(self, chat: Chat, viewer_id: str, is_online: Callable[[str], bool] = lambda user_id: False) -> dict:
+        participants = []
+        for participant_id in chat.participant_ids:
+            try:
+                user = self._users.get_user(participant_id)
+            except LookupError:
+                continue  # account deleted; the chat stays readable
+            participants.append({**user.sender_dict(), "is_online": is_online(user.id), "last_seen": None})
+        last = chat.messages[-1] if chat.messages else None
+        return {
+            "id": chat.id,
+            "name": chat.name,
+            "is_group": chat.is_group,
+            "created_at": format_timestamp(chat.created_at),
+            "updated_at": format_timestamp(chat.updated_at),
+            "participants": participants,
+            "last_message": last.content if last else None,
+            "last_message_time": format_timestamp(last.created_at) if last else None,
+            "unread_count": len(chat.messages) - chat.read_counts.get(viewer_id, 0),
+        }
@@ -0,0 +1,41 @@
+"""The set of services one server process runs with."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.services.auth.auth_service import AuthService
+from src.services.chat.chat_service import ChatService
+from src.services.post.post_events import PostEventBroker
+from src.services.post.post_service import PostService
+from src.services.user.user_service import UserService
+from src.services.websocket.connections import ConnectionRegistry
+
+
+@dataclass
+class Services:
+    users: UserService
+    auth: AuthService
+    posts: PostService
+    post_events: PostEventBroker
+    chats: ChatService
+    connections: ConnectionRegistry
+    media_dir: Path
+
+    @classmethod
+    def create(cls, secret: bytes, media_dir: Path) -> Services:
+        users = UserService()
+        posts = PostService()
+        post_events = PostEventBroker()
+        posts.add_listener(post_events)
+        media_dir.mkdir(parents=True, exist_ok=True)
+        return cls(
+            users=users,
+            auth=AuthService(users, secret),
+            posts=posts,
+            post_events=post_events,
+            chats=ChatService(users),
+            connections=ConnectionRegistry(),
+            media_dir=media_dir,
+        )
@@ -0,0 +1,188 @@
+"""Grid-cell spatial index over post coordinates.
+
+The world is cut into square lat/lng cells. Each occupied cell holds the
+points that fall inside it, so a radius query only has to look at the rings
+of cells around the query point instead of every post in the store.
+
+Post density varies by orders of magnitude between a city centre and the
+steppe, so the index keeps a few grid levels, each ``refine`` times finer
+than the last, and answers each query on the finest level where the query
+cell is still well populated. That keeps the number of distance checks per
+query roughly constant as the store grows.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+DEFAULT_CELL_SIZE_DEG = 0.02  # coarsest level, ~2.2 km north-south
+DEFAULT_LEVELS = 3
+DEFAULT_REFINE = 4
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class _Grid:
+    """One level of the index: a uniform grid that wraps at the antimeridian."""
+
+    __slots__ = ("cell_size_deg", "columns", "cells")
+
+    def __init__(self, cell_size_deg: float):
+        self.cell_size_deg = cell_size_deg
+        self.columns = max(1, round(360.0 / cell_size_deg))
+        self.cells: dict[tuple[int, int], dict[str, tuple[float, float]]] = {}
+
+    def key(self, lat: float, lng: float) -> tuple[int, int]:
+        row = math.floor(lat / self.cell_size_deg)
+        col = math.floor(lng / self.cell_size_deg) % self.columns
+        return row, col
+
+    def add(self, point_id: str, lat: float, lng: float) -> None:
+        self.cells.setdefault(self.key(lat, lng), {})[point_id] = (lat, lng)
+
+    def discard(self, point_id: str, lat: float, lng: float) -> None:
+        key = self.key(lat, lng)
+        cell = self.cells.get(key)
+        if cell is not None:
+            cell.pop(point_id, None)
+            if not cell:
+                del self.cells[key]
+
+    def column_distance(self, a: int, b: int) -> int:
+        d = abs(a - b) % self.columns
+        return min(d, self.columns - d)
+
+    def ring(self, row: int, col: int, radius: int):
+        """Yield the occupied cells exactly ``radius`` steps away from (row, col)."""
+        cells = self.cells
+        columns = self.columns
+        if radius == 0:
+            cell = cells.get((row, col))
+            if cell:
+                yield cell
+            return
+        for dc in range(-radius, radius + 1):
+            c = (col + dc) % columns
+            for r in (row - radius, row + radius):
+                cell = cells.get((r, c))
+                if cell:
+                    yield cell
+        for dr in range(-radius + 1, radius):
+            for c in ((col - radius) % columns, (col + radius) % columns):
+                cell = cells.get((row + dr, c))
+                if cell:
+                    yield cell
+
+    def nearest(self, lat: float, lng: float, radius_km: float, limit: int) -> list[tuple[float, str]]:
+        size = self.cell_size_deg
+        # Longitude degrees shrink towards the poles; use the narrowest
+        # latitude the search could reach so the ring bound stays a lower bound.
+        lat_reach = min(90.0, abs(lat) + radius_km / KM_PER_DEGREE + size)
+        km_per_step = size * KM_PER_DEGREE * max(math.cos(math.radians(lat_reach)), 1e-6)
+        max_ring = min(math.ceil(radius_km / km_per_step) + 1, self.columns // 2)
+
+        row, col = self.key(lat, lng)
+        best: list[tuple[float, str]] = []  # max-heap via negated distances
+        visited = 0
+
+        def consider(cell: dict[str, tuple[float, float]]) -> None:
+            for point_id, (plat, plng) in cell.items():
+                distance = haversine_km(lat, lng, plat, plng)
+                if distance > radius_km:
+                    continue
+                if len(best) < limit:
+                    heapq.heappush(best, (-distance, point_id))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, point_id))
+
+        for ring in range(max_ring + 1):
+            # Nothing in this ring can be closer than (ring - 1) full cells.
+            bound = (ring - 1) * km_per_step
+            if bound > radius_km or (len(best) == limit and bound > -best[0][0]):
+                break
+            if ring and (2 * max_ring + 1) ** 2 - (2 * ring - 1) ** 2 > len(self.cells) - visited:
+                # Sparse grid: scanning the occupied cells left is cheaper
+                # than probing every empty cell in the remaining rings.
+                for (r, c), cell in self.cells.items():
+                    if max(abs(r - row), self.column_distance(c, col)) >= ring:
+                        consider(cell)
+                break
+            for cell in self.ring(row, col, ring):
+                visited += 1
+                consider(cell)
+
+        return sorted((-negated, point_id) for negated, point_id in best)
+
+
+class GeoGridIndex:
+    """Maps point ids to grid cells and answers k-nearest-within-radius queries."""
+
+    def __init__(
+        self,
+        cell_size_deg: float = DEFAULT_CELL_SIZE_DEG,
+        levels: int = DEFAULT_LEVELS,
+        refine: int = DEFAULT_REFINE,
+    ):
+        if cell_size_deg <= 0 or levels < 1 or refine < 2:
+            raise ValueError("cell_size_deg must be positive, levels >= 1 and refine >= 2")
+        self._grids = [_Grid(cell_size_deg / refine**level) for level in range(levels)]
+        self._points: dict[str, tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, point_id: str) -> bool:
+        return point_id in self._points
+
+    def get(self, point_id: str) -> tuple[float, float] | None:
+        return self._points.get(point_id)
+
+    def insert(self, point_id: str, lat: float, lng: float) -> None:
+        """Add a point, or move it if the id is already indexed."""
+        if point_id in self._points:
+            self.remove(point_id)
+        self._points[point_id] = (lat, lng)
+        for grid in self._grids:
+            grid.add(point_id, lat, lng)
+
+    def remove(self, point_id: str) -> bool:
+        location = self._points.pop(point_id, None)
+        if location is None:
+            return False
+        for grid in self._grids:
+            grid.discard(point_id, *location)
+        return True
+
+    def _grid_for(self, lat: float, lng: float, limit: int) -> _Grid:
+        # Descend while the query cell alone holds well over a page of
+        # points: a finer grid then finds the same answer in fewer checks.
+        chosen = self._grids[0]
+        for grid in self._grids[1:]:
+            if len(chosen.cells.get(chosen.key(lat, lng), ())) <= 2 * limit:
+                break
+            chosen = grid
+        return chosen
+
+    def nearest(self, lat: float, lng: float, radius_km: float, limit: int) -> list[tuple[float, str]]:
+        """Return up to ``limit`` ``(distance_km, point_id)`` pairs within
+        ``radius_km`` of the query point, nearest first.
+
+        Rings of cells are visited outward from the query cell. The search
+        stops once the closest possible point in the next ring is farther
+        than the current k-th result or the radius.
+        """
+        if limit <= 0 or radius_km < 0 or not self._points:
+            return []
+        return self._grid_for(lat, lng, limit).nearest(lat, lng, radius_km, limit)
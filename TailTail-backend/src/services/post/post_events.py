@@ -0,0 +1,175 @@
+"""Fan-out of post writes to live subscribers.
+
+``PostService`` calls its listeners synchronously on every create, update
+and delete. ``PostEventBroker`` is one such listener: it matches the event
+against each subscription's filters and drops it on that subscription's
+queue, where the WebSocket session picks it up and forwards it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from src.services.post.post_service import Post, format_timestamp
+
+POST_CREATED = "post_created"
+POST_UPDATED = "post_updated"
+POST_DELETED = "post_deleted"
+POST_EVENT_TYPES = (POST_CREATED, POST_UPDATED, POST_DELETED)
+
+# Sent instead of further events once a subscriber falls this far behind;
+# the client then catches up with a changed-since delta.
+POSTS_RESYNC = "posts_resync"
+DEFAULT_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    min_lat: float
+    min_lng: float
+    max_lat: float
+    max_lng: float
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BoundingBox:
+        box = cls(float(data["min_lat"]), float(data["min_lng"]), float(data["max_lat"]), float(data["max_lng"]))
+        if box.min_lat > box.max_lat:
+            raise ValueError("min_lat must not exceed max_lat")
+        return box
+
+    def contains(self, lat: float, lng: float) -> bool:
+        if not self.min_lat <= lat <= self.max_lat:
+            return False
+        if self.min_lng <= self.max_lng:
+            return self.min_lng <= lng <= self.max_lng
+        # Box crosses the antimeridian.
+        return lng >= self.min_lng or lng <= self.max_lng
+
+
+@dataclass(frozen=True, slots=True)
+class PostFilter:
+    """Optional per-connection filters; ``None`` means "any"."""
+
+    statuses: frozenset[str] | None = None
+    species: frozenset[str] | None = None
+    bbox: BoundingBox | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> PostFilter:
+        data = data or {}
+
+        def names(key: str) -> frozenset[str] | None:
+            value = data.get(key)
+            if value is None:
+                return None
+            if isinstance(value, str):
+                value = [value]
+            return frozenset(str(item).lower() for item in value)
+
+        bbox = data.get("bbox")
+        return cls(
+            statuses=names("status"),
+            species=names("species"),
+            bbox=BoundingBox.from_dict(bbox) if bbox else None,
+        )
+
+    def matches(self, post: Post) -> bool:
+        if self.statuses is not None and (post.status or "").lower() not in self.statuses:
+            return False
+        if self.species is not None and (post.pet_species or "").lower() not in self.species:
+            return False
+        if self.bbox is not None:
+            if post.last_seen_location is None or not self.bbox.contains(*post.last_seen_location):
+                return False
+        return True
+
+
+def build_event(event_type: str, post: Post) -> dict:
+    if event_type == POST_DELETED:
+        data = {"id": post.id}
+    else:
+        data = post.to_dict()
+    return {
+        "type": event_type,
+        "data": data,
+        # Lets a client resume with changed_since() after a reconnect.
+        "watermark": format_timestamp(post.updated_at),
+    }
+
+
+class PostSubscription:
+    def __init__(self, broker: PostEventBroker, post_filter: PostFilter, maxsize: int):
+        self._broker = broker
+        self.filter = post_filter
+        self.queue: asyncio.Queue[tuple[float, dict]] = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def offer(self, published_at: float, event: dict) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait((published_at, event))
+        except asyncio.QueueFull:
+            # Drop the backlog and tell the client to resync rather than
+            # silently losing events.
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait((published_at, {"type": POSTS_RESYNC, "data": {}}))
+
+    async def get(self) -> tuple[float, dict]:
+        """Next ``(published_at, event)``; ``published_at`` is a
+        ``time.perf_counter()`` reading taken on the write path."""
+        item = await self.queue.get()
+        if item[1]["type"] == POSTS_RESYNC:
+            self.overflowed = False
+        return item
+
+    def close(self) -> None:
+        self._broker.unsubscribe(self)
+
+
+class PostEventBroker:
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self._queue_size = queue_size
+        self._subscriptions: set[PostSubscription] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, post_filter: PostFilter | None = None) -> PostSubscription:
+        subscription = PostSubscription(self, post_filter or PostFilter(), self._queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: PostSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def __call__(self, event_type: str, post: Post, previous: Post | None = None) -> None:
+        """``PostService`` listener entry point."""
+        self.publish(event_type, post, previous)
+
+    def publish(self, event_type: str, post: Post, previous: Post | None = None) -> None:
+        """Queue the event for every matching subscription.
+
+        For updates ``previous`` is the post before the edit. A subscriber
+        whose filter matched the old state but not the new one (the pet was
+        marked found, or the pin moved out of the box) gets ``post_deleted``
+        so its map drops the pin.
+        """
+        if event_type not in POST_EVENT_TYPES:
+            raise ValueError(f"unknown post event {event_type!r}")
+        published_at = time.perf_counter()
+        events: dict[str, dict] = {}
+        for subscription in self._subscriptions:
+            if subscription.filter.matches(post):
+                kind = event_type
+            elif previous is not None and subscription.filter.matches(previous):
+                kind = POST_DELETED
+            else:
+                continue
+            if kind not in events:
+                events[kind] = build_event(kind, post)
+            subscription.offer(published_at, events[kind])
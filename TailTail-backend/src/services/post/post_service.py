@@ -1 +1,369 @@
- 
\ No newline at end of file
+"""Post storage and queries behind the /api/v1/posts endpoints.
+
+Posts live in memory keyed by id. A ``GeoGridIndex`` over
+``last_seen_location`` answers nearby queries, a list kept sorted by
+``(created_at, id)`` backs the paged feed, and a second list sorted by
+``(updated_at, id)`` answers "what changed since" delta queries.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+import math
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+
+from src.services.post.geo_index import GeoGridIndex
+
+POST_STATUSES = ("lost", "found", "active")
+
+# Fields a client may set on create/update. Everything else is server-owned.
+EDITABLE_FIELDS = (
+    "pet_name",
+    "pet_species",
+    "pet_breed",
+    "age",
+    "gender",
+    "weight",
+    "color",
+    "images",
+    "location_name",
+    "last_seen_location",
+    "description",
+    "contact_phone",
+    "status",
+)
+
+
+# Deleted ids are remembered this long so delta clients can drop them.
+TOMBSTONE_RETENTION = timedelta(days=7)
+
+
+# listener(event_type, post, previous): event_type is "post_created",
+# "post_updated" or "post_deleted"; previous is the pre-edit copy on updates.
+PostListener = Callable[[str, "Post", "Post | None"], None]
+
+
+class PostNotFoundError(LookupError):
+    pass
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, matching what the API has always returned."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def format_timestamp(value: datetime) -> str:
+    # The iOS client decodes "yyyy-MM-dd'T'HH:mm:ss.SSSSSS" without a zone.
+    return value.isoformat(timespec="microseconds")
+
+
+def parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def encode_cursor(created_at: datetime, post_id: str) -> str:
+    raw = f"{format_timestamp(created_at)}|{post_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, post_id = raw.split("|", 1)
+        return parse_timestamp(created_at), post_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError(f"invalid cursor {cursor!r}") from None
+
+
+@dataclass(slots=True)
+class Post:
+    id: str
+    user_id: str
+    created_at: datetime
+    updated_at: datetime
+    status: str = "lost"
+    pet_name: str | None = None
+    pet_species: str | None = None
+    pet_breed: str | None = None
+    age: float | None = None
+    gender: str | None = None
+    weight: float | None = None
+    color: str | None = None
+    images: list[str] = field(default_factory=list)
+    location_name: str | None = None
+    last_seen_location: tuple[float, float] | None = None  # (latitude, longitude)
+    description: str | None = None
+    contact_phone: str | None = None
+    likes_count: int = 0
+
+    def to_dict(self, is_liked: bool = False) -> dict:
+        location = None
+        if self.last_seen_location is not None:
+            location = {"latitude": self.last_seen_location[0], "longitude": self.last_seen_location[1]}
+        return {
+            "id": self.id,
+            "pet_name": self.pet_name,
+            "pet_species": self.pet_species,
+            "pet_breed": self.pet_breed,
+            "age": self.age,
+            "gender": self.gender,
+            "weight": self.weight,
+            "color": self.color,
+            "images": list(self.images),
+            "location_name": self.location_name,
+            "last_seen_location": location,
+            "description": self.description,
+            "contact_phone": self.contact_phone,
+            "user_id": self.user_id,
+            "created_at": format_timestamp(self.created_at),
+            "updated_at": format_timestamp(self.updated_at),
+            "likes_count": self.likes_count,
+            "is_liked": is_liked,
+            "status": self.status,
+        }
+
+
+def _normalize_location(value) -> tuple[float, float] | None:
+    """Accept ``(lat, lng)``, ``{"latitude", "longitude"}`` or ``None``."""
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        lat, lng = value["latitude"], value["longitude"]
+    else:
+        lat, lng = value
+    lat, lng = float(lat), float(lng)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        raise ValueError(f"coordinate out of range: {lat}, {lng}")
+    return lat, lng
+
+
+class PostService:
+    def __init__(self):
+        self._posts: dict[str, Post] = {}
+        self._order: list[tuple[datetime, str]] = []  # ascending (created_at, id)
+        self._geo = GeoGridIndex()
+        self._changes: list[tuple[datetime, str]] = []  # ascending (updated_at, id), live and deleted
+        self._tombstones: dict[str, datetime] = {}
+        self._horizon = datetime.min  # deltas from before this may have lost tombstones
+        self._clock = datetime.min
+        self._listeners: list[PostListener] = []
+        self._likes: dict[str, set[str]] = {}
+        self.complaints: list[dict] = []
+
+    def add_listener(self, listener: PostListener) -> None:
+        """Call ``listener`` after every create, update and delete."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: PostListener) -> None:
+        self._listeners.remove(listener)
+
+    def _emit(self, event_type: str, post: Post, previous: Post | None = None) -> None:
+        for listener in self._listeners:
+            listener(event_type, post, previous)
+
+    def _tick(self) -> datetime:
+        """Strictly increasing write timestamp, so ``since`` never splits a tie."""
+        now = utcnow()
+        if now <= self._clock:
+            now = self._clock + timedelta(microseconds=1)
+        self._clock = now
+        return now
+
+    def _record_change(self, post_id: str, previous: datetime | None, current: datetime) -> None:
+        if previous is not None:
+            _remove_sorted(self._changes, (previous, post_id))
+        bisect.insort(self._changes, (current, post_id))
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def get_post(self, post_id: str) -> Post:
+        try:
+            return self._posts[post_id]
+        except KeyError:
+            raise PostNotFoundError(post_id) from None
+
+    def create_post(self, user_id: str, **fields) -> Post:
+        unknown = set(fields) - set(EDITABLE_FIELDS) - {"id", "created_at"}
+        if unknown:
+            raise ValueError(f"unknown post fields: {sorted(unknown)}")
+        now = self._tick()
+        post = Post(
+            id=fields.pop("id", None) or str(uuid.uuid4()),
+            user_id=user_id,
+            created_at=fields.pop("created_at", None) or now,
+            updated_at=now,
+        )
+        self._apply(post, fields)
+        if post.id in self._posts:
+            raise ValueError(f"duplicate post id {post.id}")
+        self._posts[post.id] = post
+        bisect.insort(self._order, (post.created_at, post.id))
+        previous = self._tombstones.pop(post.id, None)
+        self._record_change(post.id, previous, post.updated_at)
+        if post.last_seen_location is not None:
+            self._geo.insert(post.id, *post.last_seen_location)
+        self._emit("post_created", post)
+        return post
+
+    def update_post(self, post_id: str, **fields) -> Post:
+        unknown = set(fields) - set(EDITABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"unknown post fields: {sorted(unknown)}")
+        post = self.get_post(post_id)
+        previous = replace(post, images=list(post.images))
+        self._apply(post, fields)
+        post.updated_at = self._tick()
+        self._record_change(post.id, previous.updated_at, post.updated_at)
+        if post.last_seen_location is None:
+            self._geo.remove(post.id)
+        else:
+            self._geo.insert(post.id, *post.last_seen_location)
+        self._emit("post_updated", post, previous)
+        return post
+
+    def delete_post(self, post_id: str) -> Post:
+        post = self._posts.pop(post_id, None)
+        if post is None:
+            raise PostNotFoundError(post_id)
+        _remove_sorted(self._order, (post.created_at, post.id))
+        self._likes.pop(post.id, None)
+        deleted_at = self._tick()
+        self._record_change(post.id, post.updated_at, deleted_at)
+        self._tombstones[post.id] = deleted_at
+        self._expire_tombstones(deleted_at - TOMBSTONE_RETENTION)
+        self._geo.remove(post.id)
+        self._emit("post_deleted", post)
+        return post
+
+    def _expire_tombstones(self, cutoff: datetime) -> None:
+        # Tombstones are inserted with increasing timestamps, so the dict's
+        # insertion order is also expiry order.
+        for post_id, deleted_at in list(self._tombstones.items()):
+            if deleted_at >= cutoff:
+                break
+            del self._tombstones[post_id]
+            _remove_sorted(self._changes, (deleted_at, post_id))
+            self._horizon = max(self._horizon, deleted_at)
+
+    @staticmethod
+    def _apply(post: Post, fields: dict) -> None:
+        for name, value in fields.items():
+            if name == "last_seen_location":
+                value = _normalize_location(value)
+            elif name == "status" and value not in POST_STATUSES:
+                raise ValueError(f"invalid status {value!r}")
+            elif name == "images":
+                value = list(value or [])
+            setattr(post, name, value)
+
+    def toggle_like(self, post_id: str, user_id: str) -> bool:
+        """Like the post, or unlike it if already liked. Returns the new state."""
+        post = self.get_post(post_id)
+        likers = self._likes.setdefault(post_id, set())
+        if user_id in likers:
+            likers.discard(user_id)
+        else:
+            likers.add(user_id)
+        post.likes_count = len(likers)
+        return user_id in likers
+
+    def is_liked(self, post_id: str, user_id: str | None) -> bool:
+        return user_id is not None and user_id in self._likes.get(post_id, ())
+
+    def report_post(self, post_id: str, user_id: str, reason: str) -> dict:
+        self.get_post(post_id)
+        complaint = {"post_id": post_id, "user_id": user_id, "complaint": reason, "created_at": utcnow()}
+        self.complaints.append(complaint)
+        return complaint
+
+    def list_posts(self, page: int = 1, size: int = 10) -> dict:
+        """Newest-first offset page in the ``PostsResponse`` shape."""
+        page = max(1, page)
+        size = max(1, size)
+        total = len(self._order)
+        end = total - (page - 1) * size
+        start = max(0, end - size)
+        keys = self._order[start:end] if end > 0 else []
+        posts = [self._posts[post_id] for _, post_id in reversed(keys)]
+        total_pages = math.ceil(total / size) if total else 0
+        return {
+            "posts": posts,
+            "total": total,
+            "page": page,
+            "per_page": size,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_prev": page > 1,
+        }
+
+    def list_posts_after(self, cursor: str | None = None, size: int = 10) -> dict:
+        """Newest-first keyset page.
+
+        ``cursor`` is the opaque ``next_cursor`` from the previous page; the
+        page starts strictly after that ``(created_at, id)`` key, so posts
+        created while the user scrolls never shift or repeat items.
+        """
+        size = max(1, size)
+        end = len(self._order)
+        if cursor is not None:
+            end = bisect.bisect_left(self._order, decode_cursor(cursor))
+        start = max(0, end - size)
+        keys = self._order[start:end]
+        posts = [self._posts[post_id] for _, post_id in reversed(keys)]
+        next_cursor = encode_cursor(*keys[0]) if start > 0 else None
+        return {"posts": posts, "next_cursor": next_cursor, "has_next": next_cursor is not None}
+
+    def changed_since(self, since: datetime | None = None, limit: int = 100) -> dict:
+        """Posts created or edited, and ids deleted, after the ``since`` watermark.
+
+        Results are oldest change first. Pass the returned ``watermark`` as
+        the next ``since``; ``has_more`` means the limit cut the delta short.
+        ``reset`` is set when ``since`` predates the tombstones still held,
+        in which case the client has to reload the feed from scratch.
+        """
+        limit = max(1, limit)
+        since = since or datetime.min
+        if since < self._horizon:
+            return {"posts": [], "deleted_ids": [], "watermark": None, "has_more": False, "reset": True}
+        start = bisect.bisect_right(self._changes, since, key=lambda change: change[0])
+        window = self._changes[start:start + limit]
+        posts, deleted_ids = [], []
+        for _, post_id in window:
+            if post_id in self._tombstones:
+                deleted_ids.append(post_id)
+            else:
+                posts.append(self._posts[post_id])
+        watermark = window[-1][0] if window else (since if since > datetime.min else None)
+        return {
+            "posts": posts,
+            "deleted_ids": deleted_ids,
+            "watermark": watermark,
+            "has_more": start + limit < len(self._changes),
+            "reset": False,
+        }
+
+    def nearby(self, lat: float, lng: float, radius_km: float = 50.0, limit: int = 20) -> list[tuple[Post, float]]:
+        """Posts within ``radius_km`` of the point, nearest first, as
+        ``(post, distance_km)`` pairs."""
+        lat, lng = _normalize_location((lat, lng))
+        hits = self._geo.nearest(lat, lng, radius_km, limit)
+        return [(self._posts[post_id], distance) for distance, post_id in hits]
+
+
+def _remove_sorted(items: list, key) -> None:
+    index = bisect.bisect_left(items, key)
+    if index < len(items) and items[index] == key:
+        del items[index]
@@ -0,0 +1,137 @@
+"""User accounts, profiles and block lists."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.services.post.post_service import format_timestamp, utcnow
+
+# The stand-in server favours throughput over brute-force resistance.
+PASSWORD_HASH_ITERATIONS = 1_000
+
+
+class UserNotFoundError(LookupError):
+    pass
+
+
+class EmailTakenError(ValueError):
+    pass
+
+
+def hash_password(password: str, salt: bytes | None = None) -> str:
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PASSWORD_HASH_ITERATIONS)
+    return f"{salt.hex()}${digest.hex()}"
+
+
+def check_password(password: str, stored: str) -> bool:
+    salt, _, _ = stored.partition("$")
+    return hmac.compare_digest(hash_password(password, bytes.fromhex(salt)), stored)
+
+
+@dataclass(slots=True)
+class User:
+    id: str
+    email: str
+    password_hash: str
+    created_at: datetime
+    name: str | None = None
+    phone: str | None = None
+    image_url: str | None = None
+    blocked: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "created_at": format_timestamp(self.created_at),
+            "image_url": self.image_url,
+        }
+
+    def sender_dict(self) -> dict:
+        """The short form embedded in chat messages and participants."""
+        return {"id": self.id, "email": self.email, "image_url": self.image_url}
+
+
+class UserService:
+    def __init__(self):
+        self._users: dict[str, User] = {}
+        self._by_email: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def create_user(self, email: str, password: str) -> User:
+        email = email.strip().lower()
+        if not email or not password:
+            raise ValueError("email and password are required")
+        if email in self._by_email:
+            raise EmailTakenError(email)
+        user = User(id=str(uuid.uuid4()), email=email, password_hash=hash_password(password), created_at=utcnow())
+        self._users[user.id] = user
+        self._by_email[email] = user.id
+        return user
+
+    def get_user(self, user_id: str) -> User:
+        try:
+            return self._users[user_id]
+        except KeyError:
+            raise UserNotFoundError(user_id) from None
+
+    def find_by_email(self, email: str) -> User | None:
+        user_id = self._by_email.get(email.strip().lower())
+        return self._users.get(user_id) if user_id else None
+
+    def update_profile(
+        self,
+        user_id: str,
+        name: str | None = None,
+        phone: str | None = None,
+        image_url: str | None = None,
+        current_password: str | None = None,
+        new_password: str | None = None,
+    ) -> User:
+        user = self.get_user(user_id)
+        if new_password is not None:
+            if current_password is None or not check_password(current_password, user.password_hash):
+                raise PermissionError("current password is incorrect")
+            user.password_hash = hash_password(new_password)
+        if name is not None:
+            user.name = name
+        if phone is not None:
+            user.phone = phone
+        if image_url is not None:
+            user.image_url = image_url
+        return user
+
+    def delete_user(self, user_id: str) -> User:
+        user = self._users.pop(user_id, None)
+        if user is None:
+            raise UserNotFoundError(user_id)
+        del self._by_email[user.email]
+        for other in self._users.values():
+            other.blocked.discard(user_id)
+        return user
+
+    def block(self, user_id: str, blocked_id: str) -> None:
+        if user_id == blocked_id:
+            raise ValueError("cannot block yourself")
+        self.get_user(blocked_id)
+        self.get_user(user_id).blocked.add(blocked_id)
+
+    def unblock(self, user_id: str, blocked_id: str) -> bool:
+        blocked = self.get_user(user_id).blocked
+        if blocked_id not in blocked:
+            return False
+        blocked.discard(blocked_id)
+        return True
+
+    def blocked_users(self, user_id: str) -> list[User]:
+        return [self._users[blocked_id] for blocked_id in self.get_user(user_id).blocked if blocked_id in self._users]
@@ -0,0 +1,42 @@
+"""Which WebSocket sessions are open for which user."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionRegistry:
+    def __init__(self):
+        self._sessions: dict[str, set] = {}
+
+    def add(self, session) -> None:
+        self._sessions.setdefault(session.user_id, set()).add(session)
+
+    def remove(self, session) -> None:
+        sessions = self._sessions.get(session.user_id)
+        if sessions is not None:
+            sessions.discard(session)
+            if not sessions:
+                del self._sessions[session.user_id]
+
+    def is_online(self, user_id: str) -> bool:
+        return user_id in self._sessions
+
+    def __len__(self) -> int:
+        return sum(len(sessions) for sessions in self._sessions.values())
+
+    async def send_to_user(self, user_id: str, frame: dict, exclude=None) -> int:
+        """Send ``frame`` to every open session of ``user_id``; returns how
+        many sessions it reached."""
+        targets = [session for session in self._sessions.get(user_id, ()) if session is not exclude]
+        results = await asyncio.gather(*(session.send(frame) for session in targets), return_exceptions=True)
+        delivered = 0
+        for session, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.info("dropping frame for %s: %s", session.user_id, result)
+            else:
+                delivered += 1
+        return delivered
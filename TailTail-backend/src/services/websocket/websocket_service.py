@@ -0,0 +1,154 @@
+"""Protocol handling for the /api/v1/websocket/ws/{user_id} channel.
+
+Every frame is a JSON envelope ``{"type": ..., "data": {...}}``. A
+``WebSocketSession`` owns one connection's state and is transport-agnostic:
+the server hands it decoded frames and a ``send`` coroutine.
+
+Chat frames:
+
+- ``ping`` is answered with ``pong``.
+- ``send_message`` (``chat_id``, ``content``) is answered with
+  ``message_sent``; the other participants' open sessions get
+  ``new_message`` with the same message.
+- ``get_messages`` (``chat_id``) is answered with ``messages``.
+- ``list_chats`` is answered with ``chat_list``.
+
+Post feed frames:
+
+- ``subscribe_posts`` with optional ``status``, ``species`` (a name or a
+  list) and ``bbox`` (``min_lat``, ``min_lng``, ``max_lat``, ``max_lng``)
+  starts ``post_created`` / ``post_updated`` / ``post_deleted`` pushes.
+  Subscribing again replaces the filters.
+- ``unsubscribe_posts`` stops them.
+
+Anything that fails is answered with ``error`` and ``data.message``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.services.chat.chat_service import ChatNotFoundError, ChatService
+from src.services.post.post_events import PostEventBroker, PostFilter, PostSubscription
+from src.services.websocket.connections import ConnectionRegistry
+
+logger = logging.getLogger(__name__)
+
+SendFn = Callable[[dict], Awaitable[None]]
+
+
+def error_frame(message: str) -> dict:
+    return {"type": "error", "data": {"message": message}}
+
+
+class WebSocketSession:
+    def __init__(
+        self,
+        user_id: str,
+        send: SendFn,
+        post_events: PostEventBroker,
+        chats: ChatService | None = None,
+        connections: ConnectionRegistry | None = None,
+    ):
+        self.user_id = user_id
+        self._send = send
+        self._post_events = post_events
+        self._chats = chats
+        self._connections = connections
+        self._subscription: PostSubscription | None = None
+        self._forwarder: asyncio.Task | None = None
+        self._handlers: dict[str, Callable[[dict], Awaitable[None]]] = {
+            "ping": self._on_ping,
+            "subscribe_posts": self._on_subscribe_posts,
+            "unsubscribe_posts": self._on_unsubscribe_posts,
+        }
+        if chats is not None:
+            self._handlers.update(
+                send_message=self._on_send_message,
+                get_messages=self._on_get_messages,
+                list_chats=self._on_list_chats,
+            )
+
+    async def send(self, frame: dict) -> None:
+        await self._send(frame)
+
+    async def handle(self, frame: dict) -> None:
+        frame_type = frame.get("type") if isinstance(frame, dict) else None
+        handler = self._handlers.get(frame_type)
+        if handler is None:
+            await self.send(error_frame(f"Unknown message type: {frame_type}"))
+            return
+        data = frame.get("data") or {}
+        if not isinstance(data, dict):
+            await self.send(error_frame("data must be an object"))
+            return
+        try:
+            await handler(data)
+        except ChatNotFoundError:
+            await self.send(error_frame("Chat not found"))
+        except (KeyError, TypeError, ValueError) as exc:
+            await self.send(error_frame(f"Invalid {frame_type} request: {exc}"))
+
+    async def close(self) -> None:
+        await self._stop_post_feed()
+
+    async def _on_ping(self, data: dict) -> None:
+        await self.send({"type": "pong", "data": {}})
+
+    async def _on_send_message(self, data: dict) -> None:
+        message = self._chats.send_message(str(data["chat_id"]), self.user_id, data.get("content"))
+        payload = self._chats.message_to_dict(message)
+        await self.send({"type": "message_sent", "data": payload})
+        if self._connections is None:
+            return
+        chat = self._chats.get_chat(message.chat_id)
+        frame = {"type": "new_message", "data": payload}
+        for participant_id in chat.participant_ids:
+            # The sender's other devices see the message too.
+            await self._connections.send_to_user(participant_id, frame, exclude=self)
+
+    async def _on_get_messages(self, data: dict) -> None:
+        chat_id = str(data["chat_id"])
+        messages = self._chats.get_messages(chat_id, self.user_id)
+        payload = [self._chats.message_to_dict(message) for message in messages]
+        await self.send({"type": "messages", "data": {"chat_id": chat_id, "messages": payload}})
+
+    async def _on_list_chats(self, data: dict) -> None:
+        is_online = self._connections.is_online if self._connections is not None else (lambda user_id: False)
+        chats = [self._chats.chat_to_dict(chat, self.user_id, is_online) for chat in self._chats.list_chats(self.user_id)]
+        await self.send({"type": "chat_list", "data": chats})
+
+    async def _on_subscribe_posts(self, data: dict) -> None:
+        post_filter = PostFilter.from_dict(data)
+        await self._stop_post_feed()
+        self._subscription = self._post_events.subscribe(post_filter)
+        self._forwarder = asyncio.create_task(self._forward_posts(self._subscription))
+        await self.send({"type": "posts_subscribed", "data": data})
+
+    async def _on_unsubscribe_posts(self, data: dict) -> None:
+        await self._stop_post_feed()
+        await self.send({"type": "posts_unsubscribed", "data": {}})
+
+    async def _forward_posts(self, subscription: PostSubscription) -> None:
+        while True:
+            _, event = await subscription.get()
+            try:
+                await self.send(event)
+            except ConnectionError:
+                logger.info("post feed for %s stopped: connection closed", self.user_id)
+                subscription.close()
+                return
+
+    async def _stop_post_feed(self) -> None:
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        if self._forwarder is not None:
+            self._forwarder.cancel()
+            try:
+                await self._forwarder
+            except asyncio.CancelledError:
+                pass
+            self._forwarder = None
@@ -0,0 +1,136 @@
+"""Post push events over the WebSocket session, including delivery latency.
+
+Run with pytest, or directly for the latency report:
+
+    python -m tests.test_post_events
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+from src.services.post.post_events import PostEventBroker
+from src.services.post.post_service import PostService
+from src.services.websocket.websocket_service import WebSocketSession
+
+ALMATY = {"latitude": 43.238, "longitude": 76.889}
+ASTANA = {"latitude": 51.169, "longitude": 71.449}
+ALMATY_BOX = {"min_lat": 43.0, "min_lng": 76.5, "max_lat": 43.5, "max_lng": 77.2}
+
+
+class RecordingSocket:
+    """Stands in for the transport: keeps every frame with its arrival time."""
+
+    def __init__(self):
+        self.frames: list[tuple[float, dict]] = []
+        self.arrived = asyncio.Event()
+
+    async def send(self, frame: dict) -> None:
+        self.frames.append((time.perf_counter(), frame))
+        self.arrived.set()
+
+    def types(self) -> list[str]:
+        return [frame["type"] for _, frame in self.frames]
+
+
+async def connect(broker: PostEventBroker, user_id: str, **filters) -> tuple[WebSocketSession, RecordingSocket]:
+    socket = RecordingSocket()
+    session = WebSocketSession(user_id, socket.send, broker)
+    await session.handle({"type": "subscribe_posts", "data": filters})
+    return session, socket
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_filters_and_lifecycle():
+    async def scenario():
+        posts = PostService()
+        broker = PostEventBroker()
+        posts.add_listener(broker)
+        _, everything = await connect(broker, "a")
+        _, lost_in_almaty = await connect(broker, "b", status="lost", bbox=ALMATY_BOX)
+        _, cats = await connect(broker, "c", species=["cat"])
+
+        dog = posts.create_post("u1", pet_species="dog", status="lost", last_seen_location=ALMATY)
+        posts.create_post("u1", pet_species="cat", status="lost", last_seen_location=ASTANA)
+        await settle()
+        posts.update_post(dog.id, status="found")
+        posts.delete_post(dog.id)
+        await settle()
+
+        assert everything.types() == ["posts_subscribed", "post_created", "post_created", "post_updated", "post_deleted"]
+        # Marking the dog found takes it out of b's filter, so b sees a delete.
+        assert lost_in_almaty.types() == ["posts_subscribed", "post_created", "post_deleted"]
+        assert cats.types() == ["posts_subscribed", "post_created"]
+        assert cats.frames[1][1]["data"]["pet_species"] == "cat"
+
+    asyncio.run(scenario())
+
+
+def test_unsubscribe_stops_pushes():
+    async def scenario():
+        posts = PostService()
+        broker = PostEventBroker()
+        posts.add_listener(broker)
+        session, socket = await connect(broker, "a")
+        await session.handle({"type": "unsubscribe_posts", "data": {}})
+        posts.create_post("u1", status="lost")
+        await settle()
+        assert socket.types() == ["posts_subscribed", "posts_unsubscribed"]
+        assert len(broker) == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_gets_resync():
+    async def scenario():
+        posts = PostService()
+        broker = PostEventBroker(queue_size=4)
+        posts.add_listener(broker)
+        subscription = broker.subscribe()
+        for _ in range(10):
+            posts.create_post("u1", status="lost")
+        _, event = await subscription.get()
+        assert event["type"] == "posts_resync"
+        assert subscription.queue.empty()
+
+    asyncio.run(scenario())
+
+
+async def measure_delivery_latency(subscribers: int, posts_to_create: int) -> list[float]:
+    """Milliseconds from ``create_post`` being called to the frame reaching
+    each subscriber's ``send``."""
+    posts = PostService()
+    broker = PostEventBroker()
+    posts.add_listener(broker)
+    sockets = [(await connect(broker, f"user-{i}"))[1] for i in range(subscribers)]
+    await settle()
+
+    latencies = []
+    for i in range(posts_to_create):
+        for socket in sockets:
+            socket.arrived.clear()
+        started = time.perf_counter()
+        posts.create_post("author", pet_name=f"pet {i}", status="lost", last_seen_location=ALMATY)
+        await asyncio.gather(*(socket.arrived.wait() for socket in sockets))
+        latencies.extend((socket.frames[-1][0] - started) * 1000 for socket in sockets)
+    return latencies
+
+
+def test_delivery_latency():
+    latencies = asyncio.run(measure_delivery_latency(subscribers=200, posts_to_create=50))
+    assert len(latencies) == 200 * 50
+    # Generous bound: this is a regression guard, not a benchmark.
+    assert statistics.quantiles(latencies, n=100)[98] < 250
+
+
+if __name__ == "__main__":
+    for subscribers in (10, 100, 1000):
+        samples = asyncio.run(measure_delivery_latency(subscribers, posts_to_create=50))
+        cuts = statistics.quantiles(samples, n=100)
+        print(f"{subscribers:>5} subscribers: p50 {cuts[49]:.3f} ms  p95 {cuts[94]:.3f} ms  p99 {cuts[98]:.3f} ms")
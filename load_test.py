@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Asyncio load generator for the TailTrail REST and chat WebSocket APIs.
+
+Each virtual user runs the same flow as test_websocket_full.py /
+test_real_chat.py / test_send_message.py (signup, login, WebSocket connect,
+send_message), then loops over a weighted mix of operations until the test
+ends:
+
+    rest_posts   GET  /api/v1/posts/?page=1&size=5
+    rest_chats   GET  /api/v1/chat/chats
+    ws_send      send_message over the WebSocket, timed until message_sent
+    ws_ping      ping over the WebSocket, timed until pong
+
+Users are started evenly over --ramp seconds. At the end it prints
+throughput and p50/p95/p99 latency per operation.
+
+    python3 load_test.py --users 200 --ramp 10 --duration 30
+    TAILTRAIL_BASE_URL=http://host:8080 python3 load_test.py
+
+Requires aiohttp. The default target is a local server, so nothing leaves
+the machine unless --base-url says so.
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import json
+import random
+import time
+import uuid
+
+import aiohttp
+
+from settings import BASE_URL as DEFAULT_BASE_URL
+
+PASSWORD = "password123"
+
+DEFAULT_MIX = "rest_posts=4,rest_chats=2,ws_send=3,ws_ping=1"
+WS_REPLIES = {"ws_send": ("message_sent",), "ws_ping": ("pong",)}
+
+
+def decode_jwt(token):
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))
+
+
+def percentile(ordered, q):
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = collections.defaultdict(list)
+        self.errors = collections.Counter()
+        self.error_samples = {}
+        self.started = None
+        self.finished = None
+
+    def record(self, op, seconds):
+        self.latencies[op].append(seconds * 1000)
+
+    def fail(self, op, reason):
+        self.errors[op] += 1
+        self.error_samples.setdefault(op, reason)
+
+    def report(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        ops = sorted(set(self.latencies) | set(self.errors))
+        print(f"\n{'operation':<12} {'ok':>8} {'err':>6} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        total = 0
+        for op in ops:
+            samples = sorted(self.latencies[op])
+            total += len(samples)
+            print(
+                f"{op:<12} {len(samples):>8} {self.errors[op]:>6} {len(samples) / elapsed:>9.1f} "
+                f"{percentile(samples, 0.50):>9.2f} {percentile(samples, 0.95):>9.2f} "
+                f"{percentile(samples, 0.99):>9.2f} {(samples[-1] if samples else float('nan')):>9.2f}"
+            )
+        print(f"\n{total} operations in {elapsed:.1f}s = {total / elapsed:.1f} ops/s")
+        for op, reason in self.error_samples.items():
+            print(f"  first {op} error: {reason}")
+
+
+class VirtualUser:
+    def __init__(self, index, args, session, stats, directory):
+        self.index = index
+        self.args = args
+        self.session = session
+        self.stats = stats
+        self.directory = directory  # index -> user_id of users that have logged in
+        self.rng = random.Random(args.seed + index)
+        self.token = None
+        self.user_id = None
+        self.chat_id = None
+        self.ws = None
+        self.pending = collections.defaultdict(collections.deque)  # reply type -> futures
+        self.reader = None
+
+    @property
+    def headers(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    async def timed(self, op, coro):
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(coro, self.args.timeout)
+        except Exception as exc:
+            self.stats.fail(op, f"{type(exc).__name__}: {exc}")
+            return None
+        self.stats.record(op, time.perf_counter() - started)
+        return result
+
+    async def post_json(self, path, body, headers=None):
+        async with self.session.post(self.args.base_url + path, json=body, headers=headers) as response:
+            text = await response.text()
+            if response.status >= 400:
+                raise RuntimeError(f"{path} -> {response.status}: {text[:120]}")
+            return json.loads(text) if text else {}
+
+    async def get_json(self, path):
+        async with self.session.get(self.args.base_url + path, headers=self.headers) as response:
+            text = await response.text()
+            if response.status >= 400:
+                raise RuntimeError(f"{path} -> {response.status}: {text[:120]}")
+            return json.loads(text)
+
+    async def setup(self):
+        email = f"load_{self.args.run_id}_{self.index}@example.com"
+        credentials = {"email": email, "password": PASSWORD}
+        if await self.timed("signup", self.post_json("/api/v1/auth/signup", credentials)) is None:
+            return False
+        login = await self.timed("login", self.post_json("/api/v1/auth/login", credentials))
+        if not login:
+            return False
+        self.token = login.get("token") or login.get("access_token")
+        self.user_id = decode_jwt(self.token)["user_id"]
+        self.directory[self.index] = self.user_id
+
+        ws_url = self.args.base_url.replace("http", "ws", 1) + f"/api/v1/websocket/ws/{self.user_id}"
+        self.ws = await self.timed("ws_connect", self.session.ws_connect(ws_url, headers=self.headers, heartbeat=None))
+        if self.ws is None:
+            return False
+        self.reader = asyncio.create_task(self.read_frames())
+
+        # Pair up with the previous user so send_message has somewhere to go.
+        partner = self.directory.get(self.index - 1)
+        if partner:
+            chat = await self.timed(
+                "create_chat", self.post_json("/api/v1/chat/chats", {"participant_ids": [partner]}, self.headers)
+            )
+            if chat:
+                self.chat_id = chat.get("id") or chat.get("chat_id")
+        return True
+
+    async def read_frames(self):
+        async for message in self.ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                continue
+            frame = json.loads(message.data)
+            kind = frame.get("type")
+            if kind == "error":
+                # No correlation ids: blame the oldest outstanding request.
+                error = RuntimeError(frame.get("data", {}).get("message"))
+                for queue in self.pending.values():
+                    if self.settle(queue, exception=error):
+                        break
+                continue
+            queue = self.pending.get(kind)
+            if queue:
+                self.settle(queue, result=frame)
+        for queue in self.pending.values():
+            while self.settle(queue, exception=ConnectionError("WebSocket closed")):
+                pass
+
+    @staticmethod
+    def settle(queue, result=None, exception=None):
+        """Resolve the oldest future still waiting; timed-out ones are skipped."""
+        while queue:
+            future = queue.popleft()
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+            return True
+        return False
+
+    async def ws_request(self, op, frame):
+        future = asyncio.get_running_loop().create_future()
+        self.pending[WS_REPLIES[op][0]].append(future)
+        await self.ws.send_str(json.dumps(frame))
+        return await future
+
+    async def run_op(self, op):
+        if op == "rest_posts":
+            await self.timed(op, self.get_json("/api/v1/posts/?page=1&size=5"))
+        elif op == "rest_chats":
+            await self.timed(op, self.get_json("/api/v1/chat/chats"))
+        elif op == "ws_ping":
+            await self.timed(op, self.ws_request(op, {"type": "ping", "data": {}}))
+        elif op == "ws_send":
+            if self.chat_id is None:
+                return await self.run_op("ws_ping")
+            frame = {"type": "send_message", "data": {"chat_id": self.chat_id, "content": f"load {uuid.uuid4()}"}}
+            await self.timed(op, self.ws_request(op, frame))
+
+    async def run(self, deadline, ops, weights):
+        try:
+            if not await self.setup():
+                return
+            while time.perf_counter() < deadline:
+                await self.run_op(self.rng.choices(ops, weights)[0])
+                if self.args.think > 0:
+                    await asyncio.sleep(self.rng.expovariate(1 / self.args.think))
+        finally:
+            if self.ws is not None:
+                await self.ws.close()
+            if self.reader is not None:
+                await asyncio.gather(self.reader, return_exceptions=True)
+
+
+def parse_mix(spec):
+    ops, weights = [], []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("rest_posts", "rest_chats", "ws_send", "ws_ping"):
+            raise SystemExit(f"unknown operation in --mix: {name}")
+        ops.append(name)
+        weights.append(float(weight or 1))
+    return ops, weights
+
+
+async def main(args):
+    ops, weights = parse_mix(args.mix)
+    stats = Stats()
+    directory = {}
+    connector = aiohttp.TCPConnector(limit=args.connections, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=None)
+
+    print(f"🚀 {args.users} users against {args.base_url}, ramp {args.ramp}s, run {args.duration}s")
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        stats.started = time.perf_counter()
+        deadline = stats.started + args.ramp + args.duration
+        tasks = []
+        for index in range(args.users):
+            user = VirtualUser(index, args, session, stats, directory)
+            tasks.append(asyncio.create_task(user.run(deadline, ops, weights)))
+            if args.ramp > 0:
+                await asyncio.sleep(args.ramp / args.users)
+        await asyncio.gather(*tasks)
+        stats.finished = time.perf_counter()
+    stats.report()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="TailTrail REST + WebSocket load generator")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which users connect")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run after the ramp")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"operation weights (default {DEFAULT_MIX})")
+    parser.add_argument("--think", type=float, default=0.0, help="mean think time between operations, seconds")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--connections", type=int, default=100, help="HTTP connection pool size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    args.base_url = args.base_url.rstrip("/")
+    args.run_id = uuid.uuid4().hex[:8]
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Where the test scripts send their requests.
+
+    TAILTRAIL_BASE_URL   API origin, default http://127.0.0.1:8080 (the local
+                         server: cd TailTail-backend && python -m src.main)
+    TAILTRAIL_TOKEN      bearer token to use; when unset, auth_token() signs up
+                         and logs in a dev user against BASE_URL
+
+Set TAILTRAIL_BASE_URL=http://209.38.237.102:8080 to hit the shared box.
+"""
+
+import json
+import os
+import urllib.error
+import urllib.request
+
+BASE_URL = os.environ.get("TAILTRAIL_BASE_URL", "http://127.0.0.1:8080").rstrip("/")
+WS_URL = "ws" + BASE_URL[len("http"):]
+
+DEV_EMAIL = os.environ.get("TAILTRAIL_EMAIL", "dev@tailtrail.local")
+DEV_PASSWORD = os.environ.get("TAILTRAIL_PASSWORD", "password123")
+
+
+def _post(path, body):
+    request = urllib.request.Request(
+        BASE_URL + path,
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read() or b"{}")
+
+
+def auth_token(email=DEV_EMAIL, password=DEV_PASSWORD):
+    token = os.environ.get("TAILTRAIL_TOKEN")
+    if token:
+        return token
+    credentials = {"email": email, "password": password}
+    try:
+        _post("/api/v1/auth/signup", credentials)
+    except urllib.error.HTTPError:
+        pass  # already registered
+    return _post("/api/v1/auth/login", credentials)["token"]
@@ -0,0 +1,21 @@
+"""Async Python client for the TailTrail API.
+
+``TailTrailClient`` wraps the REST endpoints on a pooled keep-alive
+session; ``ChatSocket`` (``client.socket()``) is a persistent, self-healing
+chat/feed WebSocket. Requires aiohttp.
+"""
+
+from tailtrail_client.client import TailTrailClient
+from tailtrail_client.errors import ApiError, SocketError, TailTrailError
+from tailtrail_client.realtime import ChatSocket
+from tailtrail_client.tokens import TokenClaims, token_claims
+
+__all__ = [
+    "ApiError",
+    "ChatSocket",
+    "SocketError",
+    "TailTrailClient",
+    "TailTrailError",
+    "TokenClaims",
+    "token_claims",
+]
@@ -0,0 +1,290 @@
+"""REST side of the SDK.
+
+One ``TailTrailClient`` owns one ``aiohttp.ClientSession`` whose connector
+keeps connections alive between calls, so a script making twenty requests
+pays for one TCP (and TLS) handshake instead of twenty. Several clients
+(say, the virtual users of load_test.py) can share a session by passing
+``session=``; the client then leaves closing it to the caller.
+
+    async with TailTrailClient(BASE_URL) as client:
+        await client.login(email, password)
+        page = await client.list_posts(size=5)
+        async with client.socket() as ws:
+            await ws.send_message(chat_id, "hi")
+"""
+
+from __future__ import annotations
+
+import json
+import mimetypes
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+
+from tailtrail_client.errors import ApiError
+from tailtrail_client.models import (
+    Chat,
+    LikeResult,
+    Message,
+    Post,
+    PostsCursorPage,
+    PostsDelta,
+    PostsPage,
+    User,
+)
+from tailtrail_client.realtime import ChatSocket
+from tailtrail_client.tokens import TokenClaims, token_claims
+
+DEFAULT_POOL_SIZE = 100
+DEFAULT_KEEPALIVE_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 10.0
+# Log in again this long before exp rather than racing it.
+TOKEN_REFRESH_LEEWAY = 30.0
+
+
+class TailTrailClient:
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        *,
+        email: str | None = None,
+        password: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_SECONDS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self._email = email
+        self._password = password
+        self._session = session
+        self._owns_session = session is None
+        self._pool_size = pool_size
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+
+    async def __aenter__(self) -> TailTrailClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size, keepalive_timeout=self._keepalive_timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self._timeout)
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    # -- auth -------------------------------------------------------------
+
+    @property
+    def claims(self) -> TokenClaims:
+        if self.token is None:
+            raise RuntimeError("not logged in")
+        return token_claims(self.token)
+
+    @property
+    def user_id(self) -> str:
+        return self.claims.user_id
+
+    @property
+    def can_login(self) -> bool:
+        """Whether the client holds credentials to renew its token."""
+        return bool(self._email and self._password)
+
+    @property
+    def ws_base_url(self) -> str:
+        return "ws" + self.base_url[len("http"):]
+
+    async def signup(self, email: str, password: str) -> dict:
+        return await self.request("POST", "/api/v1/auth/signup", json={"email": email, "password": password}, auth=False)
+
+    async def login(self, email: str | None = None, password: str | None = None) -> str:
+        """Log in and keep the credentials so an expired token can be renewed."""
+        email = email or self._email
+        password = password or self._password
+        if not email or not password:
+            raise RuntimeError("no credentials to log in with")
+        body = await self.request("POST", "/api/v1/auth/login", json={"email": email, "password": password}, auth=False)
+        self.token = body.get("token") or body.get("access_token")
+        self._email, self._password = email, password
+        return self.token
+
+    async def register(self, email: str, password: str) -> str:
+        """Sign up (ignoring "already registered") and log in."""
+        try:
+            await self.signup(email, password)
+        except ApiError as exc:
+            if exc.status != 400:
+                raise
+        return await self.login(email, password)
+
+    async def ensure_token(self) -> str:
+        """The current token, renewed first if it is about to expire and the
+        client knows the credentials."""
+        if self.token is None:
+            if not self.can_login:
+                raise RuntimeError("not logged in")
+            return await self.login()
+        if self.can_login and self.claims.expired(leeway=TOKEN_REFRESH_LEEWAY):
+            return await self.login()
+        return self.token
+
+    async def auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {await self.ensure_token()}"}
+
+    # -- transport --------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: dict | None = None,
+        data: Any = None,
+        auth: bool = True,
+    ) -> Any:
+        """Send one request on the pooled session and decode the JSON reply.
+
+        Raises ``ApiError`` for 4xx/5xx. A 401 on an authenticated call is
+        retried once after logging in again, if the client can.
+        """
+        for attempt in (0, 1):
+            headers = await self.auth_headers() if auth else None
+            async with self.session.request(
+                method, self.base_url + path, json=json, params=params, data=data, headers=headers
+            ) as response:
+                text = await response.text()
+                if response.status < 400:
+                    return _loads(text)
+                error = ApiError(response.status, _detail(text), method, path)
+            if error.status == 401 and auth and attempt == 0 and self.can_login:
+                await self.login()
+                continue
+            raise error
+
+    def socket(self, **options) -> ChatSocket:
+        """A persistent WebSocket for this user; see ``ChatSocket``."""
+        return ChatSocket(self, **options)
+
+    # -- users ------------------------------------------------------------
+
+    async def profile(self) -> User:
+        return await self.request("GET", "/api/v1/users/profile")
+
+    async def update_profile(self, *, photo: str | Path | None = None, **fields) -> User:
+        """``name``, ``phone``, ``current_password``/``new_password``; ``photo``
+        is a local image file uploaded as ``profile_image``."""
+        if photo is None:
+            return await self.request("PATCH", "/api/v1/users/profile", json=fields)
+        form = _form(fields, {"profile_image": [photo]})
+        return await self.request("PATCH", "/api/v1/users/profile", data=form)
+
+    async def delete_account(self) -> None:
+        await self.request("DELETE", "/api/v1/users/profile")
+
+    async def block_user(self, user_id: str) -> dict:
+        return await self.request("POST", "/api/v1/users/block/", json={"blocked_id": user_id})
+
+    async def unblock_user(self, user_id: str) -> None:
+        await self.request("DELETE", f"/api/v1/users/block/{user_id}")
+
+    async def blocked_users(self) -> list[User]:
+        return await self.request("GET", "/api/v1/users/block/")
+
+    # -- posts ------------------------------------------------------------
+
+    async def list_posts(self, page: int = 1, size: int = 10) -> PostsPage:
+        return await self.request("GET", "/api/v1/posts/", params={"page": page, "size": size})
+
+    async def posts_after(self, cursor: str | None = None, size: int = 10) -> PostsCursorPage:
+        return await self.request("GET", "/api/v1/posts/", params={"cursor": cursor or "", "size": size})
+
+    async def posts_changed_since(self, since: str | None = None, limit: int = 100) -> PostsDelta:
+        return await self.request("GET", "/api/v1/posts/", params={"since": since or "", "limit": limit})
+
+    async def nearby_posts(self, lat: float, lng: float, radius_km: float = 50.0, limit: int = 20) -> list[Post]:
+        params = {"lat": lat, "lng": lng, "radius": radius_km, "limit": limit}
+        return (await self.request("GET", "/api/v1/posts/nearby", params=params))["posts"]
+
+    async def get_post(self, post_id: str) -> Post:
+        return await self.request("GET", f"/api/v1/posts/{post_id}")
+
+    async def create_post(self, *, photos: list[str | Path] = (), **fields) -> Post:
+        """Fields use the API names (``pet_name``, ``status``, ``lat``/``lng``
+        ...). ``photos`` are local image files, sent as a multipart upload
+        like the iOS app does."""
+        if photos:
+            body = await self.request("POST", "/api/v1/posts/", data=_form(fields, {"images": photos}))
+        else:
+            body = await self.request("POST", "/api/v1/posts/", json=fields)
+        return body["post"]
+
+    async def update_post(self, post_id: str, **fields) -> Post:
+        return (await self.request("PATCH", f"/api/v1/posts/{post_id}", json=fields))["post"]
+
+    async def delete_post(self, post_id: str) -> None:
+        await self.request("DELETE", f"/api/v1/posts/{post_id}")
+
+    async def like_post(self, post_id: str) -> LikeResult:
+        return await self.request("POST", f"/api/v1/posts/{post_id}/like")
+
+    async def report_post(self, post_id: str, complaint: str) -> dict:
+        return await self.request("POST", f"/api/v1/posts/{post_id}/complaint", json={"complaint": complaint})
+
+    # -- chats ------------------------------------------------------------
+
+    async def list_chats(self) -> list[Chat]:
+        return await self.request("GET", "/api/v1/chat/chats")
+
+    async def create_chat(self, user_id: str) -> Chat:
+        """Open (or reuse) the one-to-one chat with ``user_id``."""
+        return await self.request("POST", "/api/v1/chat/chats", json={"participant_ids": [user_id]})
+
+    async def delete_chat(self, chat_id: str) -> dict:
+        return await self.request("DELETE", f"/api/v1/chat/chats/{chat_id}")
+
+    async def get_messages(self, chat_id: str) -> list[Message]:
+        return await self.request("GET", f"/api/v1/messages/chats/{chat_id}/messages")
+
+
+def _loads(text: str) -> Any:
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def _detail(text: str):
+    body = _loads(text)
+    if isinstance(body, dict) and "detail" in body:
+        return body["detail"]
+    return (text or "")[:200]
+
+
+def _form(fields: dict, files: dict[str, list]) -> aiohttp.FormData:
+    form = aiohttp.FormData()
+    for name, value in fields.items():
+        if value is not None:
+            form.add_field(name, str(value))
+    for name, paths in files.items():
+        for path in paths:
+            path = Path(path)
+            content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            form.add_field(name, path.read_bytes(), filename=path.name, content_type=content_type)
+    return form
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+
+class TailTrailError(Exception):
+    pass
+
+
+class ApiError(TailTrailError):
+    """A REST call answered with a 4xx/5xx status.
+
+    ``detail`` is the ``{"detail": ...}`` message when the body has one,
+    otherwise the start of the body text.
+    """
+
+    def __init__(self, status: int, detail, method: str = "", path: str = ""):
+        super().__init__(f"{method} {path} -> {status}: {detail}".strip())
+        self.status = status
+        self.detail = detail
+        self.method = method
+        self.path = path
+
+    @property
+    def token_expired(self) -> bool:
+        return self.status == 401 and "expired" in str(self.detail).lower()
+
+
+class SocketError(TailTrailError):
+    """The server answered a WebSocket request with an ``error`` frame."""
+
+    def __init__(self, message: str, frame_type: str | None = None):
+        super().__init__(message)
+        self.message = message
+        self.frame_type = frame_type
@@ -0,0 +1,107 @@
+"""Shapes of the JSON the API returns, for type checkers and editors.
+
+They mirror the Codable models in TailTrail/Models. Responses are plain
+dicts at runtime.
+"""
+
+from __future__ import annotations
+
+from typing import TypedDict
+
+
+class Location(TypedDict):
+    latitude: float
+    longitude: float
+
+
+class User(TypedDict, total=False):
+    id: str
+    email: str
+    name: str | None
+    phone: str | None
+    image_url: str | None
+    created_at: str
+
+
+class Sender(TypedDict):
+    id: str
+    email: str
+    image_url: str | None
+
+
+class Participant(Sender, total=False):
+    is_online: bool
+    last_seen: str | None
+
+
+class Message(TypedDict):
+    id: str
+    chat_id: str
+    sender: Sender
+    content: str
+    created_at: str
+    updated_at: str | None
+
+
+class Chat(TypedDict):
+    id: str
+    name: str | None
+    is_group: bool
+    created_at: str
+    updated_at: str
+    participants: list[Participant]
+    last_message: str | None
+    last_message_time: str | None
+    unread_count: int
+
+
+class Post(TypedDict, total=False):
+    id: str
+    user_id: str
+    created_at: str
+    updated_at: str
+    status: str
+    pet_name: str | None
+    pet_species: str | None
+    pet_breed: str | None
+    age: float | None
+    gender: str | None
+    weight: float | None
+    color: str | None
+    images: list[str]
+    location_name: str | None
+    last_seen_location: Location | None
+    description: str | None
+    contact_phone: str | None
+    likes_count: int
+    is_liked: bool
+    distance_km: float
+
+
+class PostsPage(TypedDict):
+    posts: list[Post]
+    total: int
+    page: int
+    per_page: int
+    total_pages: int
+    has_next: bool
+    has_prev: bool
+
+
+class PostsCursorPage(TypedDict):
+    posts: list[Post]
+    next_cursor: str | None
+    has_next: bool
+
+
+class PostsDelta(TypedDict):
+    posts: list[Post]
+    deleted_ids: list[str]
+    watermark: str | None
+    has_more: bool
+    reset: bool
+
+
+class LikeResult(TypedDict):
+    liked: bool
+    likes_count: int
@@ -0,0 +1,267 @@
+"""WebSocket side of the SDK.
+
+``ChatSocket`` keeps one connection to /api/v1/websocket/ws/{user_id} open
+for as long as it is used. A background task owns the connection: it
+reads every frame, answers waiting requests, queues pushes
+(``new_message``, ``post_*``) for ``events()``, and when the connection
+drops it reconnects with exponential backoff, logs in again if the token
+was rejected, and restores the post feed subscription. aiohttp's
+``heartbeat`` pings the server so a dead link is noticed within
+``heartbeat`` seconds rather than at the next send.
+
+Replies carry no correlation id, so each request waits for the next frame
+of its reply type; an ``error`` frame fails the oldest waiting request.
+Requests that were in flight when the connection dropped fail with
+``ConnectionError`` and are not replayed (``send_message`` is not
+idempotent).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from tailtrail_client.errors import ApiError, SocketError
+
+if TYPE_CHECKING:
+    from tailtrail_client.client import TailTrailClient
+    from tailtrail_client.models import Chat, Message
+
+logger = logging.getLogger(__name__)
+
+REPLY_TYPES = {
+    "ping": "pong",
+    "send_message": "message_sent",
+    "get_messages": "messages",
+    "list_chats": "chat_list",
+    "subscribe_posts": "posts_subscribed",
+    "unsubscribe_posts": "posts_unsubscribed",
+}
+PUSH_TYPES = frozenset({"new_message", "post_created", "post_updated", "post_deleted", "posts_resync"})
+
+DEFAULT_HEARTBEAT_SECONDS = 20.0
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+
+
+class ChatSocket:
+    def __init__(
+        self,
+        client: TailTrailClient,
+        *,
+        heartbeat: float | None = DEFAULT_HEARTBEAT_SECONDS,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        event_queue_size: int = DEFAULT_EVENT_QUEUE_SIZE,
+    ):
+        self._client = client
+        self._heartbeat = heartbeat
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._events: asyncio.Queue[dict] = asyncio.Queue(event_queue_size)
+        # (reply type or None for "whatever comes next", future), oldest first
+        self._waiting: deque[tuple[str | None, asyncio.Future]] = deque()
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._connected = asyncio.Event()
+        self._runner: asyncio.Task | None = None
+        self._closed = False
+        self._failure: BaseException | None = None
+        self._post_filters: dict | None = None
+        self.connects = 0
+
+    async def __aenter__(self) -> ChatSocket:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    async def connect(self, timeout: float | None = None) -> None:
+        """Start the connection task and wait until the socket is open."""
+        if self._runner is None:
+            self._closed = False
+            self._runner = asyncio.create_task(self._run())
+        await asyncio.wait_for(self._wait_connected(), timeout)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._ws is not None:
+            await self._ws.close()
+        if self._runner is not None:
+            self._runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._runner
+            self._runner = None
+        self._fail_waiting(ConnectionError("WebSocket closed"))
+
+    # -- requests ---------------------------------------------------------
+
+    async def request(self, frame_type: str, data: dict | None = None, reply: str | None = ...) -> Any:
+        """Send ``{"type", "data"}`` and return the ``data`` of the reply.
+
+        ``reply`` defaults to the known reply type for ``frame_type``; pass
+        ``None`` to take whatever non-push frame arrives next (for probing
+        frame types the SDK does not know).
+        """
+        if reply is ...:
+            reply = REPLY_TYPES.get(frame_type)
+        future = asyncio.get_running_loop().create_future()
+        await self._wait_connected()
+        self._waiting.append((reply, future))
+        try:
+            await self._ws.send_str(json.dumps({"type": frame_type, "data": data or {}}, ensure_ascii=False))
+        except (ConnectionError, RuntimeError) as exc:
+            self._discard(future)
+            raise ConnectionError(f"WebSocket send failed: {exc}") from exc
+        try:
+            frame = await future
+        finally:
+            self._discard(future)
+        return frame.get("data")
+
+    async def ping(self) -> None:
+        await self.request("ping")
+
+    async def send_message(self, chat_id: str, content: str) -> Message:
+        return await self.request("send_message", {"chat_id": chat_id, "content": content})
+
+    async def get_messages(self, chat_id: str) -> list[Message]:
+        return (await self.request("get_messages", {"chat_id": chat_id}))["messages"]
+
+    async def list_chats(self) -> list[Chat]:
+        return await self.request("list_chats")
+
+    async def subscribe_posts(self, **filters) -> dict:
+        """Start post feed pushes; ``status``, ``species``, ``bbox`` as in
+        the server protocol. The subscription survives reconnects."""
+        result = await self.request("subscribe_posts", filters)
+        self._post_filters = filters
+        return result
+
+    async def unsubscribe_posts(self) -> None:
+        self._post_filters = None
+        await self.request("unsubscribe_posts")
+
+    # -- pushes -----------------------------------------------------------
+
+    async def next_event(self, timeout: float | None = None) -> dict:
+        """The next pushed frame (``new_message``, ``post_created`` ...)."""
+        return await asyncio.wait_for(self._events.get(), timeout)
+
+    async def events(self):
+        while True:
+            yield await self._events.get()
+
+    # -- connection task --------------------------------------------------
+
+    async def _wait_connected(self) -> None:
+        while not self._connected.is_set():
+            if self._failure is not None:
+                raise self._failure
+            if self._runner is None or self._runner.done():
+                raise ConnectionError("WebSocket is not connected")
+            waiter = asyncio.ensure_future(self._connected.wait())
+            await asyncio.wait({waiter, self._runner}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+
+    async def _run(self) -> None:
+        delay = self._reconnect_delay
+        while not self._closed:
+            try:
+                ws = await self._open()
+            except aiohttp.WSServerHandshakeError as exc:
+                if exc.status == 401 and self._client.can_login:
+                    try:
+                        await self._client.login()
+                    except ApiError as login_error:
+                        self._failure = login_error
+                        return
+                elif 400 <= exc.status < 500:
+                    self._failure = ConnectionError(f"WebSocket rejected: {exc.status} {exc.message}")
+                    return
+                logger.info("WebSocket handshake failed (%s), retrying in %.1fs", exc.status, delay)
+            except (aiohttp.ClientError, OSError, asyncio.TimeoutError) as exc:
+                logger.info("WebSocket connect failed (%s), retrying in %.1fs", exc, delay)
+            else:
+                delay = self._reconnect_delay
+                await self._serve(ws)
+                continue
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    async def _open(self) -> aiohttp.ClientWebSocketResponse:
+        headers = await self._client.auth_headers()
+        url = f"{self._client.ws_base_url}/api/v1/websocket/ws/{self._client.user_id}"
+        return await self._client.session.ws_connect(url, headers=headers, heartbeat=self._heartbeat)
+
+    async def _serve(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        self._ws = ws
+        self.connects += 1
+        self._connected.set()
+        if self.connects > 1 and self._post_filters is not None:
+            # Re-establish the feed; the reply is not awaited by anyone.
+            resubscribed = asyncio.get_running_loop().create_future()
+            resubscribed.add_done_callback(lambda future: future.cancelled() or future.exception())
+            self._waiting.append(("posts_subscribed", resubscribed))
+            await ws.send_str(json.dumps({"type": "subscribe_posts", "data": self._post_filters}))
+        try:
+            async for message in ws:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    self._dispatch(json.loads(message.data))
+        finally:
+            self._connected.clear()
+            self._ws = None
+            if not ws.closed:
+                await ws.close()
+            self._fail_waiting(ConnectionError("WebSocket connection lost"))
+            if not self._closed:
+                logger.info("WebSocket closed (code %s), reconnecting", ws.close_code)
+
+    def _dispatch(self, frame: dict) -> None:
+        kind = frame.get("type")
+        if kind == "error":
+            message = (frame.get("data") or {}).get("message", "unknown error")
+            if not self._settle(lambda reply: True, exception=SocketError(message)):
+                logger.warning("unsolicited error frame: %s", message)
+            return
+        if kind not in PUSH_TYPES:
+            if not self._settle(lambda reply: reply is None or reply == kind, result=frame):
+                logger.debug("dropping %s reply nobody is waiting for", kind)
+            return
+        if self._events.full():
+            self._events.get_nowait()  # keep the newest pushes
+        self._events.put_nowait(frame)
+
+    def _settle(self, wanted, result=None, exception=None) -> bool:
+        for entry in self._waiting:
+            reply, future = entry
+            if future.done() or not wanted(reply):
+                continue
+            self._waiting.remove(entry)
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+            return True
+        return False
+
+    def _discard(self, future: asyncio.Future) -> None:
+        for entry in self._waiting:
+            if entry[1] is future:
+                self._waiting.remove(entry)
+                return
+
+    def _fail_waiting(self, exception: BaseException) -> None:
+        while self._waiting:
+            _, future = self._waiting.popleft()
+            if not future.done():
+                future.set_exception(exception)
@@ -0,0 +1,70 @@
+"""Bearer token claims, decoded once per token.
+
+The client never verifies signatures (it does not have the secret); it only
+needs ``user_id`` for the WebSocket path and ``exp`` to know when to log in
+again. Decoded claims are kept in a small LRU keyed by the token string and
+dropped once the token has expired.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    user_id: str
+    expires_at: float | None  # Unix seconds; None when the token has no exp
+    claims: dict = field(compare=False, repr=False)
+
+    def expired(self, now: float | None = None, leeway: float = 0.0) -> bool:
+        if self.expires_at is None:
+            return False
+        return (time.time() if now is None else now) + leeway >= self.expires_at
+
+    def ttl(self, now: float | None = None) -> float | None:
+        """Seconds until expiry (negative once expired)."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - (time.time() if now is None else now)
+
+
+_cache: OrderedDict[str, TokenClaims] = OrderedDict()
+
+
+def decode_claims(token: str) -> TokenClaims:
+    """Parse the payload segment of ``token``. Raises ``ValueError`` if the
+    token is not a JWT or carries no ``user_id``."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("not a JWT") from None
+    if not isinstance(claims, dict) or "user_id" not in claims:
+        raise ValueError("token has no user_id claim")
+    exp = claims.get("exp")
+    return TokenClaims(user_id=str(claims["user_id"]), expires_at=float(exp) if exp is not None else None, claims=claims)
+
+
+def token_claims(token: str) -> TokenClaims:
+    """Cached ``decode_claims``; an entry lives until its token's ``exp``."""
+    cached = _cache.get(token)
+    if cached is not None:
+        if not cached.expired():
+            _cache.move_to_end(token)
+            return cached
+        del _cache[token]
+    claims = decode_claims(token)
+    if not claims.expired():
+        _cache[token] = claims
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return claims
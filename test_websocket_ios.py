@@ -8,11 +8,13 @@ import sys
 import time
 import base64
 
-print("🚀 Testing WebSocket connection to: ws://209.38.237.102:8080")
+from settings import BASE_URL, WS_URL
+
+print(f"🚀 Testing WebSocket connection to: {WS_URL}")
 print("=====================================")
 
 # Test credentials
-base_url = "http://209.38.237.102:8080"
+base_url = BASE_URL
 test_email = f"test_ws_{int(time.time())}@example.com"
 test_password = "password123"
 
@@ -96,7 +98,7 @@ async def test_websocket():
         print("❌ No token available, cannot connect to WebSocket")
         return
         
-    uri = f"ws://209.38.237.102:8080/api/v1/websocket/ws/{user_id}"
+    uri = f"{WS_URL}/api/v1/websocket/ws/{user_id}"
     
     print(f"\n2️⃣ Connecting to WebSocket...")
     print(f"URL: {uri}")
@@ -125,7 +127,7 @@ async def test_websocket():
                 
                 # Method 3: Try without user ID in path
                 print("\n🔄 Trying base WebSocket URL...")
-                base_ws_uri = "ws://209.38.237.102:8080/api/v1/websocket/ws"
+                base_ws_uri = f"{WS_URL}/api/v1/websocket/ws"
                 try:
                     async with websockets.connect(base_ws_uri, additional_headers=headers) as websocket:
                         print("✅ Connected to WebSocket!")